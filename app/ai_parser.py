@@ -3,15 +3,206 @@ AI Parser module for processing natural language commands using Ollama
 Extracts company name and job type from user input
 """
 
+import asyncio
+import functools
+import hashlib
 import json
 import logging
-import requests
-from typing import Dict, Optional, Any
+import re
+import threading
+from collections import OrderedDict
+
+import httpx
+import numpy as np
+from typing import Dict, List, Optional, Any, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from app.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Connection pool limits shared by the sync and async Ollama clients
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=40, max_connections=100, keepalive_expiry=30.0)
+
+# Outermost {...} block in a model response (first '{' through last '}')
+_JSON_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Fallback patterns fused into one anchored regex per field. Each branch
+# starts with a lazy (?s:.*?) so earlier branches win over later ones no
+# matter where they occur in the input, same as trying them in order.
+_PT_RE = re.compile(
+    r'^(?:'
+    r'(?s:.*?)(PT\s+[\w\s]+?),'  # PT Company Name, ...
+    r'|(?s:.*?)(PT\s+[\w\s]+?)\s+untuk'  # PT Company Name untuk ...
+    r'|(?s:.*?)(PT\s+[\w\s]+?)\s+dari'  # PT Company Name dari ...
+    r')',
+    re.IGNORECASE
+)
+
+_JOB_RE = re.compile(
+    r'^(?:'
+    r'(?s:.*?)(?:pekerjaan|pengurusan|perpanjangan)\s+([^.!,\n]+)'
+    r'|(?s:.*?)untuk\s+([^.!,\n]+)'
+    r'|(?s:.*?)file\s+.*?\s+([^.!,\n]+)'
+    r')',
+    re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _fallback_extract(user_input: str) -> Tuple[str, str]:
+    """
+    Pattern-match company and job type from user input
+
+    Pure function of the input, so results are memoized.
+
+    Returns:
+        (company, job_type), each "Unknown" when not found
+    """
+    # Simple pattern matching for common patterns
+    company = "Unknown"
+    job_type = "Unknown"
+
+    # Try to extract company name with "PT"
+    match = _PT_RE.match(user_input)
+    if match:
+        company = match.group(match.lastindex).strip()
+
+    # Try to extract job type
+    match = _JOB_RE.match(user_input)
+    if match:
+        job_type = match.group(match.lastindex).strip()
+
+    return company, job_type
+
+
+class LLMCache:
+    """
+    Two-tier cache for parsed LLM responses
+    Exact tier keyed by a hash of the normalized input, semantic tier
+    matching paraphrases by cosine similarity of their embeddings
+    """
+
+    def __init__(self, model: str, maxsize: int = 256, similarity_threshold: float = 0.92):
+        """
+        Initialize the cache
+
+        Args:
+            model: Model name, mixed into keys so switching models invalidates entries
+            maxsize: Maximum number of exact-match entries kept (LRU eviction)
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+        """
+        self.model = model
+        self.maxsize = maxsize
+        self.similarity_threshold = similarity_threshold
+        self._exact = OrderedDict()
+        # Semantic tier as parallel arrays: row i of _vectors (L2-normalized)
+        # belongs to _responses[i]. Rows are reused oldest-first once full.
+        self._vectors = None
+        self._responses = []
+        self._next_slot = 0
+        self.stats = {"hits": 0, "misses": 0}
+        # Sidecar parsing (watcher thread) and prompts (prompt worker) share the cache
+        self._lock = threading.Lock()
+
+    def make_key(self, user_input: str) -> str:
+        """Build the exact-match key for a user input"""
+        return hashlib.sha256((self.model + user_input.strip().lower()).encode()).hexdigest()
+
+    def get(self, user_input: str) -> Optional[Dict[str, str]]:
+        """
+        Look up an exact match for the user input
+
+        Returns:
+            Cached response copy, or None on miss
+        """
+        key = self.make_key(user_input)
+        with self._lock:
+            response = self._exact.get(key)
+            if response is None:
+                return None
+
+            self._exact.move_to_end(key)
+            self.stats["hits"] += 1
+            return dict(response)
+
+    def get_similar(self, embedding: np.ndarray) -> Optional[Dict[str, str]]:
+        """
+        Look up the closest cached response by embedding similarity
+
+        Returns:
+            Cached response copy, or None if nothing exceeds the threshold
+        """
+        norm = np.linalg.norm(embedding)
+        query = embedding / norm if norm else embedding
+
+        with self._lock:
+            if not self._responses:
+                return None
+
+            similarities = self._vectors[:len(self._responses)] @ query
+
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.similarity_threshold:
+                return None
+
+            self.stats["hits"] += 1
+            return dict(self._responses[best])
+
+    def put(self, user_input: str, response: Dict[str, str], embedding: Optional[np.ndarray] = None):
+        """
+        Store a parsed response
+
+        Args:
+            user_input: Original user input
+            response: Parsed response to cache
+            embedding: Optional embedding of the input for the semantic tier
+        """
+        key = self.make_key(user_input)
+        with self._lock:
+            self._exact[key] = dict(response)
+            self._exact.move_to_end(key)
+            if len(self._exact) > self.maxsize:
+                self._exact.popitem(last=False)
+
+            if embedding is not None:
+                self._add_vector(embedding, dict(response))
+
+    def _add_vector(self, embedding: np.ndarray, response: Dict[str, str]):
+        """Store a normalized vector row, growing capacity by doubling up to maxsize (call with the lock held)"""
+        if self.maxsize <= 0:
+            return
+
+        norm = np.linalg.norm(embedding)
+        vector = np.asarray(embedding / norm if norm else embedding, dtype=np.float32)
+
+        count = len(self._responses)
+        if self._vectors is None:
+            self._vectors = np.empty((min(16, self.maxsize), vector.shape[0]), dtype=np.float32)
+        elif count == self._vectors.shape[0] and count < self.maxsize:
+            grown = np.empty((min(count * 2, self.maxsize), vector.shape[0]), dtype=np.float32)
+            grown[:count] = self._vectors
+            self._vectors = grown
+
+        if count < self.maxsize:
+            slot = count
+            self._responses.append(response)
+        else:
+            slot = self._next_slot
+            self._responses[slot] = response
+            self._next_slot = (slot + 1) % self.maxsize
+
+        self._vectors[slot] = vector
+
+    def record_miss(self):
+        """Count a lookup that missed both tiers"""
+        with self._lock:
+            self.stats["misses"] += 1
+
 
 class AIParser:
     """
@@ -19,11 +210,57 @@ class AIParser:
     Extracts structured information from natural language input
     """
 
+    # Sent unchanged on every request so Ollama can reuse its KV cache for it
+    _SYSTEM_PROMPT = """You are an AI assistant specialized in parsing Indonesian legal document instructions.
+Extract the company name and job type from the user's input and respond only in JSON format.
+
+Examples:
+Input: "Ini untuk PT Jaminan Nasional Indonesia, pekerjaan pengurusan izin PPIU."
+Output: {"company": "PT Jaminan Nasional Indonesia", "job_type": "pengurusan izin PPIU"}
+
+Input: "Dokumen PT Makmur Sentosa untuk perpanjangan SIUP"
+Output: {"company": "PT Makmur Sentosa", "job_type": "perpanjangan SIUP"}
+
+Input: "File untuk PT Cahaya Abadi, pengurusan NPWP"
+Output: {"company": "PT Cahaya Abadi", "job_type": "pengurusan NPWP"}
+
+Rules:
+1. Always include "PT" in company names when present
+2. Extract job type as descriptive as possible
+3. Respond ONLY with valid JSON, no explanations
+4. If you cannot extract information, use "Unknown" for both fields"""
+
     def __init__(self):
         """Initialize the AI parser with Ollama configuration"""
         self.base_url = Config.OLLAMA_BASE_URL
         self.model = Config.OLLAMA_MODEL
+        self.embed_model = Config.OLLAMA_EMBED_MODEL
         self.timeout = 30  # seconds
+        self.cache = LLMCache(
+            self.model,
+            maxsize=Config.LLM_CACHE_SIZE,
+            similarity_threshold=Config.LLM_CACHE_SIMILARITY_THRESHOLD
+        )
+
+        # Persistent client so consecutive calls reuse the same connection;
+        # HTTP/2 multiplexes concurrent calls when Ollama sits behind a TLS proxy
+        self.client = httpx.Client(
+            http2=True,
+            timeout=httpx.Timeout(self.timeout, connect=10.0),
+            limits=_HTTP_LIMITS
+        )
+
+    def close(self):
+        """Release pooled HTTP connections"""
+        self.client.close()
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
 
     def extract_company_and_job(self, user_input: str) -> Dict[str, str]:
         """
@@ -35,13 +272,121 @@ class AIParser:
         Returns:
             Dict containing 'company' and 'job_type' keys
         """
+        cached = self.cache.get(user_input)
+        if cached is not None:
+            return cached
+
+        embedding = self._embed(user_input) if self.embed_model else None
+        if embedding is not None:
+            cached = self.cache.get_similar(embedding)
+            if cached is not None:
+                return cached
+
+        self.cache.record_miss()
+
         try:
             response = self._call_ollama(user_input)
-            return self._parse_response(response)
+            result = self._parse_response(response)
         except Exception as e:
             logger.error(f"Failed to parse AI response: {str(e)}")
             return self._get_fallback_response(user_input)
 
+        self.cache.put(user_input, result, embedding)
+        return result
+
+    def extract_company_and_job_batch(self, inputs: List[str]) -> List[Dict[str, str]]:
+        """
+        Synchronous wrapper around extract_batch for callers without an event loop
+
+        Args:
+            inputs: List of natural language instructions
+
+        Returns:
+            List of dicts with 'company' and 'job_type', in input order
+        """
+        return asyncio.run(self.extract_batch(inputs))
+
+    async def extract_batch(self, inputs: List[str]) -> List[Dict[str, str]]:
+        """
+        Extract company name and job type for many inputs concurrently
+
+        Inputs already in the cache (exact or, with an embed model, similar)
+        are answered from it; all remaining Ollama calls are issued at once and
+        the server processes up to OLLAMA_NUM_PARALLEL of them in parallel
+        (set on the Ollama host).
+
+        Args:
+            inputs: List of natural language instructions
+
+        Returns:
+            List of dicts with 'company' and 'job_type', in input order
+        """
+        results: List[Optional[Dict[str, str]]] = [self.cache.get(user_input) for user_input in inputs]
+        misses = [i for i, result in enumerate(results) if result is None]
+        if not misses:
+            return results
+
+        async with httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(self.timeout, connect=10.0),
+            limits=_HTTP_LIMITS
+        ) as client:
+            # Embed all exact misses in one call, then try the semantic tier
+            embeddings = None
+            if self.embed_model:
+                embeddings = await self._embed_batch_async(client, [inputs[i] for i in misses])
+
+            pending = []
+            for row, i in enumerate(misses):
+                embedding = embeddings[row] if embeddings is not None else None
+                if embedding is not None:
+                    results[i] = self.cache.get_similar(embedding)
+                if results[i] is None:
+                    self.cache.record_miss()
+                    pending.append((i, embedding))
+
+            responses = await asyncio.gather(
+                *(self._call_ollama_async(client, inputs[i]) for i, _ in pending),
+                return_exceptions=True
+            )
+
+        for (i, embedding), response in zip(pending, responses):
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                result = self._parse_response(response)
+            except Exception as e:
+                logger.error(f"Failed to parse AI response: {str(e)}")
+                results[i] = self._get_fallback_response(inputs[i])
+                continue
+
+            self.cache.put(inputs[i], result, embedding)
+            results[i] = result
+
+        return results
+
+    def _build_payload(self, prompt: str) -> Dict[str, Any]:
+        """
+        Build the /api/generate request body for a prompt
+
+        Args:
+            prompt: Input text to process
+
+        Returns:
+            JSON-serializable request body
+        """
+        return {
+            "model": self.model,
+            "prompt": prompt,
+            "system": self._SYSTEM_PROMPT,
+            "stream": False,
+            "options": {
+                "temperature": 0.1,  # Low temperature for consistent output
+                "max_tokens": 200
+            },
+            "keep_alive": "10m"  # Keep the model loaded so the system prompt prefix stays cached
+        }
+
     def _call_ollama(self, prompt: str) -> str:
         """
         Make API call to Ollama
@@ -52,53 +397,164 @@ class AIParser:
         Returns:
             Raw response from Ollama
         """
-        system_prompt = """You are an AI assistant specialized in parsing Indonesian legal document instructions.
-Extract the company name and job type from the user's input and respond only in JSON format.
-
-Examples:
-Input: "Ini untuk PT Jaminan Nasional Indonesia, pekerjaan pengurusan izin PPIU."
-Output: {"company": "PT Jaminan Nasional Indonesia", "job_type": "pengurusan izin PPIU"}
+        try:
+            response = self.client.post(
+                f"{self.base_url}/api/generate",
+                json=self._build_payload(prompt)
+            )
+            response.raise_for_status()
 
-Input: "Dokumen PT Makmur Sentosa untuk perpanjangan SIUP"
-Output: {"company": "PT Makmur Sentosa", "job_type": "perpanjangan SIUP"}
+            data = response.json()
+            return data.get("response", "").strip()
 
-Input: "File untuk PT Cahaya Abadi, pengurusan NPWP"
-Output: {"company": "PT Cahaya Abadi", "job_type": "pengurusan NPWP"}
+        except httpx.HTTPError as e:
+            logger.error(f"Ollama API request failed: {str(e)}")
+            raise
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to decode Ollama response: {str(e)}")
+            raise
 
-Rules:
-1. Always include "PT" in company names when present
-2. Extract job type as descriptive as possible
-3. Respond ONLY with valid JSON, no explanations
-4. If you cannot extract information, use "Unknown" for both fields"""
+    async def _call_ollama_async(self, client: httpx.AsyncClient, prompt: str) -> str:
+        """
+        Make API call to Ollama on a shared async client
 
-        full_prompt = f"System: {system_prompt}\n\nUser: {prompt}\n\nAssistant:"
+        Args:
+            client: Open httpx.AsyncClient
+            prompt: Input text to process
 
+        Returns:
+            Raw response from Ollama
+        """
         try:
-            response = requests.post(
+            response = await client.post(
                 f"{self.base_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": full_prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.1,  # Low temperature for consistent output
-                        "max_tokens": 200
-                    }
-                },
-                timeout=self.timeout
+                json=self._build_payload(prompt)
             )
             response.raise_for_status()
 
             data = response.json()
             return data.get("response", "").strip()
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Ollama API request failed: {str(e)}")
             raise
         except json.JSONDecodeError as e:
             logger.error(f"Failed to decode Ollama response: {str(e)}")
             raise
 
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """
+        Compute an embedding for the semantic cache tier
+
+        Args:
+            text: Input text to embed
+
+        Returns:
+            L2-normalized embedding vector, or None if the embed call fails
+        """
+        vectors = self._embed_batch([text])
+        return vectors[0] if vectors is not None else None
+
+    def _embed_batch(self, texts: List[str]) -> Optional[np.ndarray]:
+        """
+        Compute embeddings for many texts in a single /api/embed call
+
+        Falls back to one /api/embeddings call per text on Ollama versions
+        whose response has no 'embeddings' key.
+
+        Args:
+            texts: Input texts to embed
+
+        Returns:
+            L2-normalized matrix with one row per text, or None on failure
+        """
+        try:
+            response = self.client.post(
+                f"{self.base_url}/api/embed",
+                json={"model": self.embed_model, "input": texts}
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            if "embeddings" in data:
+                embeddings = data["embeddings"]
+            else:
+                embeddings = []
+                for text in texts:
+                    response = self.client.post(
+                        f"{self.base_url}/api/embeddings",
+                        json={"model": self.embed_model, "prompt": text}
+                    )
+                    response.raise_for_status()
+                    embeddings.append(response.json()["embedding"])
+
+            return self._normalize_embeddings(embeddings, len(texts))
+
+        except Exception as e:
+            logger.warning(f"Failed to compute embeddings for cache: {str(e)}")
+            return None
+
+    async def _embed_batch_async(self, client: httpx.AsyncClient, texts: List[str]) -> Optional[np.ndarray]:
+        """
+        Compute embeddings for many texts on a shared async client
+
+        Same requests and fallback as _embed_batch, without blocking the event loop.
+
+        Args:
+            client: Open httpx.AsyncClient
+            texts: Input texts to embed
+
+        Returns:
+            L2-normalized matrix with one row per text, or None on failure
+        """
+        try:
+            response = await client.post(
+                f"{self.base_url}/api/embed",
+                json={"model": self.embed_model, "input": texts}
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            if "embeddings" in data:
+                embeddings = data["embeddings"]
+            else:
+                responses = await asyncio.gather(*(
+                    client.post(
+                        f"{self.base_url}/api/embeddings",
+                        json={"model": self.embed_model, "prompt": text}
+                    )
+                    for text in texts
+                ))
+                embeddings = []
+                for response in responses:
+                    response.raise_for_status()
+                    embeddings.append(response.json()["embedding"])
+
+            return self._normalize_embeddings(embeddings, len(texts))
+
+        except Exception as e:
+            logger.warning(f"Failed to compute embeddings for cache: {str(e)}")
+            return None
+
+    @staticmethod
+    def _normalize_embeddings(embeddings: List[List[float]], expected: int) -> Optional[np.ndarray]:
+        """
+        Stack embeddings into an L2-normalized matrix
+
+        Args:
+            embeddings: One embedding per text
+            expected: Number of texts that were embedded
+
+        Returns:
+            Normalized matrix, or None if the count doesn't match
+        """
+        if len(embeddings) != expected:
+            return None
+
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
     def _parse_response(self, response: str) -> Dict[str, str]:
         """
         Parse the AI response and extract JSON data
@@ -111,14 +567,12 @@ Rules:
         """
         try:
             # Try to find JSON in the response
-            start_idx = response.find('{')
-            end_idx = response.rfind('}') + 1
-
-            if start_idx == -1 or end_idx == 0:
+            match = _JSON_RE.search(response)
+            if not match:
                 raise ValueError("No JSON found in response")
 
-            json_str = response[start_idx:end_idx]
-            data = json.loads(json_str)
+            json_str = match.group(0)
+            data = orjson.loads(json_str) if orjson is not None else json.loads(json_str)
 
             # Validate required fields
             if 'company' not in data or 'job_type' not in data:
@@ -146,36 +600,7 @@ Rules:
         """
         logger.warning("Using fallback parsing due to AI failure")
 
-        # Simple pattern matching for common patterns
-        company = "Unknown"
-        job_type = "Unknown"
-
-        # Try to extract company name with "PT"
-        import re
-        pt_patterns = [
-            r'(PT\s+[\w\s]+?),',  # PT Company Name, ...
-            r'(PT\s+[\w\s]+?)\s+untuk',  # PT Company Name untuk ...
-            r'(PT\s+[\w\s]+?)\s+dari',  # PT Company Name dari ...
-        ]
-
-        for pattern in pt_patterns:
-            match = re.search(pattern, user_input, re.IGNORECASE)
-            if match:
-                company = match.group(1).strip()
-                break
-
-        # Try to extract job type
-        job_patterns = [
-            r'(?:pekerjaan|pengurusan|perpanjangan)\s+([^.!,\n]+)',
-            r'untuk\s+([^.!,\n]+)',
-            r'file\s+.*?\s+([^.!,\n]+)',
-        ]
-
-        for pattern in job_patterns:
-            match = re.search(pattern, user_input, re.IGNORECASE)
-            if match:
-                job_type = match.group(1).strip()
-                break
+        company, job_type = _fallback_extract(user_input)
 
         return {
             'company': company,
@@ -190,7 +615,7 @@ Rules:
             bool: True if connection successful, False otherwise
         """
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.client.get(f"{self.base_url}/api/tags", timeout=5)
             response.raise_for_status()
             models = response.json().get('models', [])
 
@@ -216,7 +641,7 @@ Rules:
             List of available model names
         """
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.client.get(f"{self.base_url}/api/tags", timeout=5)
             response.raise_for_status()
             models = response.json().get('models', [])
             return [model.get('name') for model in models]
@@ -7,10 +7,15 @@ import json
 import os
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from collections import Counter
+from itertools import chain
 import logging
-from pathlib import Path
 import re
-from fuzzywuzzy import fuzz
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -19,10 +24,26 @@ class ChecklistManager:
     Manages document checklist evaluation with flexible template support
     """
 
+    # Critical and financial document markers used by _generate_recommendations
+    _CRITICAL_DOCS = (
+        "Akta dan SK Kemenkumham",
+        "NPWP Perusahaan",
+        "NIB Perusahaan",
+        "KTP Pengurus"
+    )
+    _CRITICAL_RE = re.compile("|".join(map(re.escape, _CRITICAL_DOCS)))
+    _FINANCIAL_RE = re.compile("Keuangan|Laporan|Mutasi")
+
     def __init__(self, config):
         self.config = config
         self.checklist_templates = config.CHECKLIST_TEMPLATES
         self.document_categories = config.DOCUMENT_CATEGORIES
+        # Lower-cased required document names, computed once instead of per evaluation
+        self._required_lower = {
+            doc: doc.lower()
+            for template in self.checklist_templates.values()
+            for doc in template["required_documents"]
+        }
 
         # Document mapping for better matching
         self.category_mappings = {
@@ -66,38 +87,36 @@ class ChecklistManager:
             ]
         }
 
-    def fuzzy_match_document(self, available_categories: List[str], required_doc: str) -> Tuple[bool, float, str]:
+    def fuzzy_match_document(self, available_categories: List[str], required_doc: str,
+                             lower_categories: Optional[List[str]] = None) -> Tuple[bool, float, str]:
         """
         Use fuzzy matching to find if a required document is available
+        Scores each category with ratio, partial and token-sort matching and keeps the best
         Returns: (is_match, confidence_score, matched_category)
         """
-        best_match = None
-        best_score = 0
-        best_category = None
-
-        for category in available_categories:
-            # Direct string matching
-            direct_score = fuzz.ratio(required_doc.lower(), category.lower())
-            if direct_score > best_score:
-                best_score = direct_score
-                best_match = required_doc
-                best_category = category
-
-            # Partial matching
-            partial_score = fuzz.partial_ratio(required_doc.lower(), category.lower())
-            if partial_score > best_score:
-                best_score = partial_score
-                best_match = required_doc
-                best_category = category
-
-            # Token sort matching (good for reordered words)
-            token_score = fuzz.token_sort_ratio(required_doc.lower(), category.lower())
-            if token_score > best_score:
-                best_score = token_score
-                best_match = required_doc
-                best_category = category
-
-        return (best_score >= 60, best_score / 100.0, best_category or "")
+        # Imported on first use so non-checklist code paths don't pay for it
+        from rapidfuzz import fuzz, process
+        from rapidfuzz.utils import default_process
+
+        if lower_categories is None:
+            lower_categories = [category.lower() for category in available_categories]
+
+        query = required_doc.lower()
+        best_scores = [0] * len(lower_categories)
+
+        # token_sort_ratio strips punctuation first, as fuzzywuzzy's full_process did
+        for scorer, processor in ((fuzz.ratio, None), (fuzz.partial_ratio, None),
+                                  (fuzz.token_sort_ratio, default_process)):
+            for _, score, index in process.extract(query, lower_categories, scorer=scorer,
+                                                   processor=processor, limit=None):
+                # fuzzywuzzy reported whole-number scores; rounding keeps its threshold and confidences
+                best_scores[index] = max(best_scores[index], int(round(score)))
+
+        best_score = max(best_scores, default=0)
+        # Earlier category wins ties, matching a per-category scan
+        best_index = best_scores.index(best_score) if best_score > 0 else None
+        best_category = available_categories[best_index] if best_index is not None else ""
+        return (best_score >= 60, best_score / 100.0, best_category)
 
     def evaluate_checklist(self, checklist_type: str, available_documents: List[Dict]) -> Dict:
         """
@@ -117,9 +136,15 @@ class ChecklistManager:
             }
 
         template = self.checklist_templates[checklist_type]
-        required_docs = template["required_documents"]
-        total_required = template["total_required"]
+        return self._evaluate_with(checklist_type, template, self._preprocess(available_documents))
+
+    def _preprocess(self, available_documents: List[Dict]) -> Tuple[List[str], List[str], List[Dict], List[str], Dict[str, List[int]]]:
+        """
+        Normalize available documents once so they can be evaluated against many templates
 
+        Returns:
+            (categories, lower_categories, files, named_files, category_index)
+        """
         # Extract available document categories
         available_categories = []
         available_files = []
@@ -132,6 +157,27 @@ class ChecklistManager:
                 available_categories.append(doc)
                 available_files.append({'category': doc, 'filename': doc})
 
+        lower_categories = [category.lower() for category in available_categories]
+        # (position, lower-cased filename) for files that have a name to match against
+        named_files = [
+            (i, doc['filename'].lower()) for i, doc in enumerate(available_files) if doc.get('filename')
+        ]
+
+        # Index file positions by category so matches don't rescan every file
+        category_index = {}
+        for i, category in enumerate(available_categories):
+            category_index.setdefault(category, []).append(i)
+
+        return available_categories, lower_categories, available_files, named_files, category_index
+
+    def _evaluate_with(self, checklist_type: str, template: Dict, preprocessed: Tuple) -> Dict:
+        """
+        Evaluate a single template against documents prepared by _preprocess
+        """
+        available_categories, lower_categories, available_files, named_files, category_index = preprocessed
+        required_docs = template["required_documents"]
+        total_required = template["total_required"]
+
         # Evaluate each required document
         found_documents = []
         missing_documents = []
@@ -140,14 +186,16 @@ class ChecklistManager:
         matched_count = 0
 
         for required_doc in required_docs:
-            is_found, confidence, matched_category = self.fuzzy_match_document(available_categories, required_doc)
+            is_found, confidence, matched_category = self.fuzzy_match_document(
+                available_categories, required_doc, lower_categories
+            )
 
             if is_found:
-                # Find the actual document(s) that match
-                matching_files = [
-                    doc for doc in available_files
-                    if doc['category'] == matched_category or required_doc.lower() in doc.get('filename', '').lower()
-                ]
+                # Find the actual document(s) that match, by category or by filename
+                required_lower = self._required_lower.get(required_doc) or required_doc.lower()
+                matching_indices = set(category_index.get(matched_category, ()))
+                matching_indices.update(i for i, filename in named_files if required_lower in filename)
+                matching_files = [available_files[i] for i in sorted(matching_indices)]
 
                 found_documents.append({
                     "required": required_doc,
@@ -212,10 +260,11 @@ class ChecklistManager:
         Determine the most appropriate checklist template based on available documents
         """
         results = {}
+        preprocessed = self._preprocess(available_documents)
 
-        for checklist_type in self.checklist_templates.keys():
-            evaluation = self.evaluate_checklist(checklist_type, available_documents)
-
+        # Scoring is CPU-bound and quick, so a plain loop beats a thread pool per call
+        for checklist_type, template in self.checklist_templates.items():
+            evaluation = self._evaluate_with(checklist_type, template, preprocessed)
             if "error" not in evaluation:
                 # Calculate a score for template matching
                 score = (
@@ -267,11 +316,10 @@ class ChecklistManager:
         if not missing_docs:
             return "✅ Tidak ada dokumen yang hilang."
 
-        summary = f"❌ Dokumen yang belum ditemukan ({len(missing_docs)}):\n"
-        for i, doc in enumerate(missing_docs, 1):
-            summary += f"{i}. {doc}\n"
+        parts = [f"❌ Dokumen yang belum ditemukan ({len(missing_docs)}):\n"]
+        parts.extend(f"{i}. {doc}\n" for i, doc in enumerate(missing_docs, 1))
 
-        return summary.strip()
+        return "".join(parts).strip()
 
     def generate_available_document_summary(self, evaluation_result: Dict) -> str:
         """
@@ -281,12 +329,12 @@ class ChecklistManager:
         if not found_docs:
             return "❌ Tidak ada dokumen yang ditemukan."
 
-        summary = f"✅ Dokumen tersedia ({len(found_docs)}):\n"
+        parts = [f"✅ Dokumen tersedia ({len(found_docs)}):\n"]
         for i, doc in enumerate(found_docs, 1):
             confidence_emoji = "🟢" if doc["confidence"] >= 0.8 else "🟡" if doc["confidence"] >= 0.6 else "🔴"
-            summary += f"{i}. {doc['required']} {confidence_emoji}\n"
+            parts.append(f"{i}. {doc['required']} {confidence_emoji}\n")
 
-        return summary.strip()
+        return "".join(parts).strip()
 
     def create_checklist_report(self, evaluation_result: Dict, company_name: str = "Perusahaan") -> Dict:
         """
@@ -339,20 +387,12 @@ class ChecklistManager:
                 recommendations.append("⚠️ Masih banyak dokumen yang diperlukan. Prioritaskan dokumen-dokumen esensial.")
 
             # Specific recommendations based on missing documents
-            critical_docs = [
-                "Akta dan SK Kemenkumham",
-                "NPWP Perusahaan",
-                "NIB Perusahaan",
-                "KTP Pengurus"
-            ]
-
-            missing_critical = [doc for doc in missing_docs if any(critical in doc for critical in critical_docs)]
+            missing_critical = [doc for doc in missing_docs if self._CRITICAL_RE.search(doc)]
             if missing_critical:
                 recommendations.append("🔴 Prioritaskan dokumen-dokumen krusial: " + ", ".join(missing_critical[:3]))
 
             # Check for financial documents
-            missing_financial = [doc for doc in missing_docs if "Keuangan" in doc or "Laporan" in doc or "Mutasi" in doc]
-            if missing_financial:
+            if any(self._FINANCIAL_RE.search(doc) for doc in missing_docs):
                 recommendations.append("💰 Siapkan dokumen keuangan dan mutasi rekening.")
 
         return recommendations
@@ -368,8 +408,15 @@ class ChecklistManager:
             filename = f"checklist_{company_name}_{timestamp}.json"
             filepath = os.path.join(output_dir, filename)
 
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(evaluation_result, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(
+                        evaluation_result,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+                    ))
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(evaluation_result, f, ensure_ascii=False, indent=2)
 
             logger.info(f"Evaluation result saved to: {filepath}")
             return filepath
@@ -386,34 +433,27 @@ class ChecklistManager:
             return {"error": "No evaluations provided"}
 
         total_evaluations = len(all_evaluations)
-        total_complete = sum(1 for e in all_evaluations if e.get("status") == "complete")
-        total_nearly_complete = sum(1 for e in all_evaluations if e.get("status") == "nearly_complete")
-        total_partial = sum(1 for e in all_evaluations if e.get("status") == "partial")
-        total_incomplete = sum(1 for e in all_evaluations if e.get("status") == "incomplete")
+        status_counts = Counter(e.get("status") for e in all_evaluations)
 
         avg_completion = sum(e.get("completion_percentage", 0) for e in all_evaluations) / total_evaluations
         avg_confidence = sum(e.get("average_confidence", 0) for e in all_evaluations) / total_evaluations
 
         # Most common missing documents
-        all_missing = []
-        for eval_result in all_evaluations:
-            all_missing.extend(eval_result.get("missing_documents", []))
-
-        missing_frequency = {}
-        for doc in all_missing:
-            missing_frequency[doc] = missing_frequency.get(doc, 0) + 1
+        missing_frequency = Counter(chain.from_iterable(
+            e.get("missing_documents", ()) for e in all_evaluations
+        ))
 
         return {
             "total_evaluations": total_evaluations,
             "completion_distribution": {
-                "complete": total_complete,
-                "nearly_complete": total_nearly_complete,
-                "partial": total_partial,
-                "incomplete": total_incomplete
+                "complete": status_counts["complete"],
+                "nearly_complete": status_counts["nearly_complete"],
+                "partial": status_counts["partial"],
+                "incomplete": status_counts["incomplete"]
             },
             "average_completion_percentage": round(avg_completion, 1),
             "average_confidence": round(avg_confidence, 2),
-            "most_common_missing": sorted(missing_frequency.items(), key=lambda x: x[1], reverse=True)[:5],
+            "most_common_missing": missing_frequency.most_common(5),
             "generated_at": datetime.now().isoformat()
         }
 
@@ -4,6 +4,7 @@ Loads settings from environment variables and provides configuration constants
 """
 
 import os
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -18,50 +19,63 @@ class Config:
     # Google Drive Configuration
     GOOGLE_DRIVE_CREDENTIALS_PATH = os.getenv("GOOGLE_DRIVE_CREDENTIALS_PATH", "service_account.json")
     GOOGLE_DRIVE_FOLDER_ID = os.getenv("GOOGLE_DRIVE_FOLDER_ID", "")
+    # Seconds a completeness check result is reused for repeated report/critical-docs calls
+    COMPLETENESS_CACHE_TTL_SEC = float(os.getenv("COMPLETENESS_CACHE_TTL_SEC", "60"))
+    # Set to false when the Drive folder is not on a shared drive, to skip shared-drive lookups
+    USE_SHARED_DRIVES = os.getenv("USE_SHARED_DRIVES", "true").lower() == "true"
+    # Drive allows roughly 10 writes per second per user
+    MAX_CONCURRENT_UPLOADS = int(os.getenv("MAX_CONCURRENT_UPLOADS", "8"))
+    DRIVE_WRITES_PER_SECOND = float(os.getenv("DRIVE_WRITES_PER_SECOND", "10"))
+    # Local SQLite cache of Drive folder IDs and how long its entries stay valid
+    DRIVE_FOLDER_CACHE_PATH = os.getenv("DRIVE_FOLDER_CACHE_PATH", "data/drive_folders.db")
+    DRIVE_FOLDER_CACHE_TTL_SEC = float(os.getenv("DRIVE_FOLDER_CACHE_TTL_SEC", "86400"))
 
     # Ollama AI Configuration
     OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
     OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3")
+    OLLAMA_EMBED_MODEL = os.getenv("OLLAMA_EMBED_MODEL", "")  # Empty disables the semantic cache tier
+    LLM_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", "256"))
+    LLM_CACHE_SIMILARITY_THRESHOLD = float(os.getenv("LLM_CACHE_SIMILARITY_THRESHOLD", "0.92"))
 
     # WAHA Configuration
     WAHA_API_URL = os.getenv("WAHA_API_URL", "http://localhost:3000")
     WAHA_API_KEY = os.getenv("WAHA_API_KEY", "")
     ADMIN_WHATSAPP_NUMBER = os.getenv("ADMIN_WHATSAPP_NUMBER", "")
 
-    # Enhanced Document Categories (from new-features.md)
-    DOCUMENT_CATEGORIES = {
-        "Akta dan SK Kemenkumham": [
+    # Enhanced Document Categories (from new-features.md), read-only
+    DOCUMENT_CATEGORIES = MappingProxyType({
+        "Akta dan SK Kemenkumham": (
             "akta pendirian", "akta perubahan", "sk kemenkumham", "surat keputusan",
             "pengesahan", "notaris", "akta notaris", "anggaran dasar", "ad/art",
             "perubahan anggaran dasar", "kemenkumham", "pendirian hingga perubahan terakhir"
-        ],
-        "NIB dan NPWP": [
+        ),
+        "NIB dan NPWP": (
             "nib", "nomor induk berusaha", "npwp", "nomor pokok wajib pajak",
             "wajib pajak", "pkp", "pengusaha kena pajak", "nib perusahaan",
             "npwp perusahaan"
-        ],
-        "KTP Pengurus": [
+        ),
+        "KTP Pengurus": (
             "ktp", "kartu tanda penduduk", "nik", "nomor induk kependudukan",
             "identitas", "direktur", "komisaris", "pengurus", "ktp pengurus",
             "npwp pengurus", "identitas direktur"
-        ],
-        "Laporan Keuangan": [
+        ),
+        "Laporan Keuangan": (
             "laporan keuangan", "neraca", "laba rugi", "spt", "surat pemberitahuan tahunan",
             "mutasi rekening", "laporan audit", "audited", "tahun buku",
             "balance sheet", "income statement", "cash flow", "laporan keuangan 2 tahun",
             "neraca laba rugi", "spt tahunan"
-        ],
-        "Bank Garansi / Surety Bond": ["bank garansi", "surety bond", "jaminan", "asuransi"],
-        "IATA": ["iata", "lisensi", "sertifikat iata"],
-        "Pajak": ["spt", "bukti bayar", "faktur", "pajak", "ppn", "pph", "skt", "skf fiskal"],
-        "Dokumen Lainnya": []  # Default category
-    }
-
-    # Checklist Templates Configuration
-    CHECKLIST_TEMPLATES = {
+        ),
+        "Bank Garansi / Surety Bond": ("bank garansi", "surety bond", "jaminan", "asuransi"),
+        "IATA": ("iata", "lisensi", "sertifikat iata"),
+        "Pajak": ("spt", "bukti bayar", "faktur", "pajak", "ppn", "pph", "skt", "skf fiskal"),
+        "Dokumen Lainnya": ()  # Default category
+    })
+
+    # Checklist Templates Configuration, read-only
+    CHECKLIST_TEMPLATES = MappingProxyType({
         "BG PIHK PT": {
             "description": "Bank Garansi Penyelenggara Ibadah Haji Khusus - Perseroan Terbatas",
-            "required_documents": [
+            "required_documents": (
                 "Akta dan SK Kemenkumham Pendirian Hingga Perubahan Terakhir",
                 "KTP NPWP Pengurus",
                 "NPWP Perusahaan",
@@ -73,12 +87,12 @@ class Config:
                 "Lampiran Manifest 1000 Jamaah (Untuk PPIU < 3 Tahun)",
                 "Nomor Telepon Direktur dan Nama Ibu Kandung",
                 "Kop Surat dan Stempel Perusahaan"
-            ],
+            ),
             "total_required": 11
         },
         "BG PPIU PT": {
             "description": "Bank Garansi Penyelenggara Perjalanan Ibadah Umroh - Perseroan Terbatas",
-            "required_documents": [
+            "required_documents": (
                 "Akta dan SK Kemenkumham Pendirian Hingga Perubahan Terakhir",
                 "KTP NPWP Pengurus",
                 "NPWP Perusahaan",
@@ -88,12 +102,12 @@ class Config:
                 "Rekom / SK PPIU",
                 "Nomor Telepon Direktur dan Nama Ibu Kandung",
                 "Kop Surat dan Stempel Perusahaan"
-            ],
+            ),
             "total_required": 9
         },
         "Laporan Keuangan": {
             "description": "Laporan Keuangan Perusahaan",
-            "required_documents": [
+            "required_documents": (
                 "Kop Surat",
                 "Contoh Stempel",
                 "NIB",
@@ -109,10 +123,10 @@ class Config:
                 "Laporan Keuangan 2023 (Audited jika ada)",
                 "Neraca Laba Rugi / SPT Tahun 2024",
                 "Nomor Meteran Listrik Kantor"
-            ],
+            ),
             "total_required": 15
         }
-    }
+    })
 
     # Document Classification Settings
     DOCUMENT_CLASSIFICATION = {
@@ -120,11 +134,13 @@ class Config:
         "confidence_threshold": float(os.getenv("CLASSIFICATION_CONFIDENCE_THRESHOLD", "0.6")),
         "ocr_language": os.getenv("OCR_LANGUAGE", "ind+eng"),
         "fallback_to_filename": os.getenv("FALLBACK_TO_FILENAME", "true").lower() == "true",
-        "classification_timeout": int(os.getenv("CLASSIFICATION_TIMEOUT", "30"))
+        "classification_timeout": int(os.getenv("CLASSIFICATION_TIMEOUT", "30")),
+        # Only the first N characters of extracted text are classified
+        "classification_max_chars": int(os.getenv("CLASSIFICATION_MAX_CHARS", "4000"))
     }
 
     # Required Documents for Completeness Check (Legacy - will be replaced by checklist system)
-    REQUIRED_DOCUMENTS = [
+    REQUIRED_DOCUMENTS = (
         "Akta",
         "NIB",
         "NPWP",
@@ -133,7 +149,7 @@ class Config:
         "Bank Garansi / Surety Bond",
         "IATA",
         "Pajak"
-    ]
+    )
 
     # WhatsApp Notification Templates
     WHATSAPP_TEMPLATES = {
@@ -176,6 +192,10 @@ Silakan periksa dokumen dan coba kembali. Jika masalah berlanjut, hubungi admini
         "auto_send_checklist_results": os.getenv("AUTO_SEND_CHECKLIST_RESULTS", "true").lower() == "true",
         "notification_delay_minutes": int(os.getenv("NOTIFICATION_DELAY_MINUTES", "1")),
         "max_retries": int(os.getenv("NOTIFICATION_MAX_RETRIES", "3")),
+        "max_concurrent_sends": int(os.getenv("NOTIFICATION_MAX_CONCURRENT_SENDS", "5")),
+        "per_minute": int(os.getenv("NOTIFICATION_PER_MINUTE", "60")),
+        "burst": int(os.getenv("NOTIFICATION_BURST", "10")),
+        "priority_reserve": int(os.getenv("NOTIFICATION_PRIORITY_RESERVE", "3")),
         "admin_notification_on_error": os.getenv("ADMIN_NOTIFICATION_ON_ERROR", "true").lower() == "true"
     }
 
@@ -1,21 +1,61 @@
 import os
 import re
-import fitz
-import pytesseract
-from PIL import Image
-import cv2
-import numpy as np
-from google.cloud import vision
-import magic
+import itertools
+from array import array
+import ahocorasick
+import hashlib
 import json
 from typing import Dict, List, Tuple, Optional
 import logging
+from collections import Counter
+from datetime import datetime
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from app.config import Config
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Files up to this size are content-hashed for the result cache; larger ones use size/mtime
+_HASH_SIZE_LIMIT = 64 * 1024 * 1024
+_RESULT_CACHE_SIZE = 1024
+# Maximum images per Google Vision batch_annotate_images request
+_VISION_BATCH_SIZE = 16
+# PDFs whose text layer yields fewer characters than this are treated as scanned and OCR'd
+_MIN_PDF_TEXT_CHARS = 50
+_PDF_OCR_DPI = 200
+# Batches with fewer files that may need OCR than this are classified in-process;
+# starting worker processes and pickling the classifier costs more than it saves
+_PROCESS_POOL_MIN_FILES = 4
+
+# OCR/PDF/Vision libraries (cv2, pytesseract, fitz, google.cloud.vision) are imported
+# where they are used, so filename-only classification doesn't pay their import cost.
+
+
+# Classifier owned by a batch_classify worker process, set once by _init_worker
+_worker_classifier = None
+
+
+def _init_worker(classifier: 'DocumentClassifier', tesseract_cmd: str):
+    """
+    Set up a batch_classify worker process.
+
+    The classifier is unpickled once per worker instead of once per task, and the
+    parent's Tesseract binary path is carried over.
+    """
+    global _worker_classifier
+    import pytesseract
+    pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+    _worker_classifier = classifier
+
+
+def _classify_in_worker(file_path: str, file_size: int) -> Dict:
+    """Classify one file with the worker's classifier."""
+    return _worker_classifier._classify_uncached(file_path, file_size=file_size)
+
+
 class DocumentClassifier:
     """
     Enhanced document classifier with OCR support for Indonesian legal documents.
@@ -24,10 +64,16 @@ class DocumentClassifier:
 
     def __init__(self, use_google_vision=False):
         self.use_google_vision = use_google_vision
+        # Filename matches at or above this confidence skip text extraction entirely
+        self.confidence_threshold = Config.DOCUMENT_CLASSIFICATION['confidence_threshold']
+        # Discriminative terms appear early in a document; text past this is not classified
+        self.classification_max_chars = Config.DOCUMENT_CLASSIFICATION['classification_max_chars']
 
         # Initialize Google Vision client if enabled
+        self.vision_client = None
         if use_google_vision:
             try:
+                from google.cloud import vision
                 self.vision_client = vision.ImageAnnotatorClient()
                 logger.info("Google Vision API client initialized")
             except Exception as e:
@@ -93,10 +139,87 @@ class DocumentClassifier:
             }
         }
 
+        # Integer IDs for the scored categories, so scoring can use a flat array
+        self._cat_list = [category for category in self.document_categories if category != 'Dokumen Lainnya']
+        self._cat_ids = {category: i for i, category in enumerate(self._cat_list)}
+
+        # Single automaton over all category keywords, so one pass over the text finds every hit.
+        # Each keyword maps to the IDs of the categories listing it.
+        keyword_cat_ids = {}
+        for category in self._cat_list:
+            for keyword in self.document_categories[category]['keywords']:
+                keyword_cat_ids.setdefault(keyword, []).append(self._cat_ids[category])
+        self._keyword_automaton = ahocorasick.Automaton()
+        for keyword, cat_ids in keyword_cat_ids.items():
+            self._keyword_automaton.add_word(keyword, (keyword, tuple(cat_ids)))
+        self._keyword_automaton.make_automaton()
+
+        # Compile content patterns once; keep the source string for match details.
+        # The fused alternation lets one scan rule out a category whose patterns
+        # are all absent, which is the common case.
+        for config in self.document_categories.values():
+            config['keywords'] = tuple(config['keywords'])
+            sources = config['patterns']
+            config['patterns'] = [(re.compile(p, re.IGNORECASE), p) for p in sources]
+            config['fused_pattern'] = re.compile(
+                '|'.join(f'(?P<p{i}>{p})' for i, p in enumerate(sources)), re.IGNORECASE
+            ) if sources else None
+
+        # Filename patterns for each category
+        filename_patterns = {
+            'Akta dan SK Kemenkumham': [
+                r'akta.*pendirian', r'akta.*perubahan', r'sk.*kemenkumham',
+                r'pengesahan.*kemenkumham', r'notaris'
+            ],
+            'NIB dan NPWP': [
+                r'nib', r'npwp', r'nomor.*induk.*usaha', r'nomor.*pokok.*wajib.*pajak'
+            ],
+            'KTP Pengurus': [
+                r'ktp.*pengurus', r'ktp.*direktur', r'identitas.*pengurus'
+            ],
+            'Laporan Keuangan': [
+                r'laporan.*keuangan', r'neraca', r'laba.*rugi', r'spt.*tahunan',
+                r'mutasi.*rekening', r'audit'
+            ]
+        }
+        # Fuse the filename patterns into anchored alternations whose named groups
+        # map back to (category, pattern). Each branch starts with a lazy (?s:.*?),
+        # so earlier categories/patterns win wherever they occur, same as trying
+        # them in order: one match() call finds the winning category.
+        self._filename_groups = {}
+        self._category_filename_res = {}
+        all_branches = []
+        for ci, (category, patterns) in enumerate(filename_patterns.items()):
+            branches = []
+            for pi, p in enumerate(patterns):
+                group = f'c{ci}_p{pi}'
+                self._filename_groups[group] = (category, p)
+                branches.append(f'(?s:.*?)(?P<{group}>{p})')
+            self._category_filename_res[category] = re.compile(f"^(?:{'|'.join(branches)})", re.IGNORECASE)
+            all_branches.extend(branches)
+        self._filename_fused = re.compile(f"^(?:{'|'.join(all_branches)})", re.IGNORECASE)
+
+        # Classification results keyed by (content fingerprint, filename)
+        self._result_cache = {}
+
         # File type categories
         self.image_extensions = {'.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp'}
         self.pdf_extensions = {'.pdf'}
         self.office_extensions = {'.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx'}
+        # Scanned PDFs are OCR'd too
+        self._ocr_extensions = self.image_extensions | self.pdf_extensions
+
+        # Extension -> text extractor, so routing a file is a single lookup
+        self._ext_dispatch = {ext: self.extract_text_from_image for ext in self.image_extensions}
+        self._ext_dispatch.update({ext: self.extract_text_from_pdf for ext in self.pdf_extensions})
+        self._ext_dispatch.update({ext: self._extract_text_office for ext in self.office_extensions})
+
+    def __getstate__(self):
+        """Drop the Vision client and result cache when pickling for worker processes."""
+        state = self.__dict__.copy()
+        state['vision_client'] = None  # Rebuilt on first use
+        state['_result_cache'] = {}
+        return state
 
     def extract_text_from_image(self, image_path: str) -> str:
         """Extract text from image using Tesseract or Google Vision API."""
@@ -112,29 +235,31 @@ class DocumentClassifier:
     def _extract_text_tesseract(self, image_path: str) -> str:
         """Extract text using Tesseract OCR."""
         try:
-            # Preprocess image for better OCR accuracy
-            image = cv2.imread(image_path)
-            if image is None:
+            import cv2
+
+            # Read straight to grayscale
+            gray = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+            if gray is None:
                 return ""
 
-            # Convert to grayscale
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            return self._ocr_grayscale(gray)
+        except Exception as e:
+            logger.error(f"Tesseract OCR failed: {e}")
+            return ""
 
-            # Apply thresholding
-            _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    def _ocr_grayscale(self, gray) -> str:
+        """Binarize a grayscale image array and run Tesseract on it."""
+        import cv2
+        import pytesseract
 
-            # Noise removal
-            kernel = np.ones((1,1), np.uint8)
-            processed = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
+        # Binarize for better OCR accuracy
+        _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
 
-            # Perform OCR
-            custom_config = r'--oem 3 --psm 6 -l ind+eng'
-            text = pytesseract.image_to_string(processed, config=custom_config)
+        # Perform OCR
+        custom_config = r'--oem 3 --psm 6 -l ind+eng'
+        text = pytesseract.image_to_string(thresh, config=custom_config)
 
-            return text.strip()
-        except Exception as e:
-            logger.error(f"Tesseract OCR failed: {e}")
-            return ""
+        return text.strip()
 
     def _extract_text_google_vision(self, image_path: str) -> str:
         """Extract text using Google Vision API."""
@@ -142,55 +267,222 @@ class DocumentClassifier:
             with open(image_path, 'rb') as image_file:
                 content = image_file.read()
 
-            image = vision.Image(content=content)
-            response = self.vision_client.document_text_detection(image=image)
-
-            if response.error.message:
-                logger.error(f"Google Vision API error: {response.error.message}")
-                return ""
-
-            return response.full_text_annotation.text
+            return self._ocr_bytes_google_vision(content)
         except Exception as e:
             logger.error(f"Google Vision API failed: {e}")
             return ""
 
+    def _extract_text_google_vision_batch(self, image_paths: List[str]) -> Dict[str, str]:
+        """
+        Extract text from several images with batched Google Vision requests.
+
+        Returns:
+            Mapping of image path to extracted text. Images whose batch failed are
+            left out so the caller can fall back to per-image extraction.
+        """
+        texts = {}
+        for start in range(0, len(image_paths), _VISION_BATCH_SIZE):
+            chunk = image_paths[start:start + _VISION_BATCH_SIZE]
+            try:
+                contents = []
+                for image_path in chunk:
+                    with open(image_path, 'rb') as image_file:
+                        contents.append(image_file.read())
+                texts.update(zip(chunk, self._ocr_bytes_google_vision_batch(contents, chunk)))
+            except Exception as e:
+                logger.error(f"Google Vision batch request failed: {e}")
+
+        return texts
+
+    def _ocr_bytes_google_vision_batch(self, contents: List[bytes], labels: List[str]) -> List[str]:
+        """
+        Extract text from up to _VISION_BATCH_SIZE in-memory images in one Vision request.
+
+        Args:
+            contents: Encoded image bytes
+            labels: Name of each image for error messages
+
+        Returns:
+            Text of each image, in order ("" for images Vision couldn't read).
+            Raises if the request itself fails.
+        """
+        from google.cloud import vision
+        if self.vision_client is None:
+            self.vision_client = vision.ImageAnnotatorClient()
+
+        feature = vision.Feature(type_=vision.Feature.Type.DOCUMENT_TEXT_DETECTION)
+        requests = [
+            vision.AnnotateImageRequest(image=vision.Image(content=content), features=[feature])
+            for content in contents
+        ]
+        batch = self.vision_client.batch_annotate_images(requests=requests)
+
+        texts = []
+        for label, response in zip(labels, batch.responses):
+            if response.error.message:
+                logger.error(f"Google Vision API error for {label}: {response.error.message}")
+                texts.append("")
+            else:
+                texts.append(response.full_text_annotation.text)
+        return texts
+
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """Extract text from PDF using PyMuPDF."""
         try:
-            doc = fitz.open(pdf_path)
-            text = ""
+            import fitz
 
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                text += page.get_text()
+            parts = []
+            with fitz.open(pdf_path) as doc:
+                for page in doc:
+                    parts.append(page.get_text("text"))
 
-            doc.close()
-            return text.strip()
+            text = "".join(parts).strip()
         except Exception as e:
             logger.error(f"Error extracting text from PDF {pdf_path}: {e}")
             return ""
 
+        # No usable text layer: most likely a scanned PDF
+        if len(text) < _MIN_PDF_TEXT_CHARS:
+            return self._ocr_pdf(pdf_path) or text
+        return text
+
+    def _ocr_pdf(self, pdf_path: str, max_chars: Optional[int] = None) -> str:
+        """
+        OCR a scanned PDF by rendering each page straight to a grayscale array.
+
+        Every page costs a Tesseract run or a Vision call, so with max_chars set,
+        pages stop being OCR'd once that many characters have been collected.
+        With Google Vision, pages are sent _VISION_BATCH_SIZE at a time, so the
+        cap is checked after each batch.
+        """
+        try:
+            import fitz
+            import numpy as np
+
+            parts = []
+            length = 0
+            with fitz.open(pdf_path) as doc:
+                pages = iter(doc)
+                while max_chars is None or length < max_chars:
+                    if self.use_google_vision:
+                        pngs = [
+                            page.get_pixmap(dpi=_PDF_OCR_DPI, colorspace=fitz.csGRAY, alpha=False).tobytes("png")
+                            for page in itertools.islice(pages, _VISION_BATCH_SIZE)
+                        ]
+                        if not pngs:
+                            break
+                        labels = [f"{pdf_path} page {len(parts) + i + 1}" for i in range(len(pngs))]
+                        texts = self._ocr_bytes_google_vision_batch(pngs, labels)
+                    else:
+                        page = next(pages, None)
+                        if page is None:
+                            break
+                        pix = page.get_pixmap(dpi=_PDF_OCR_DPI, colorspace=fitz.csGRAY, alpha=False)
+                        gray = np.frombuffer(pix.samples, np.uint8).reshape(pix.height, pix.width)
+                        texts = [self._ocr_grayscale(gray)]
+                    parts.extend(texts)
+                    length += sum(len(text) for text in texts)
+
+            return "\n".join(parts).strip()
+        except Exception as e:
+            logger.error(f"OCR of PDF {pdf_path} failed: {e}")
+            return ""
+
+    def _ocr_bytes_google_vision(self, content: bytes) -> str:
+        """Extract text from in-memory image bytes using Google Vision API."""
+        from google.cloud import vision
+        if self.vision_client is None:
+            self.vision_client = vision.ImageAnnotatorClient()
+
+        response = self.vision_client.document_text_detection(image=vision.Image(content=content))
+        if response.error.message:
+            logger.error(f"Google Vision API error: {response.error.message}")
+            return ""
+        return response.full_text_annotation.text
+
+    def _pdf_pages(self, pdf_path: str):
+        """Yield the text of each PDF page in order."""
+        import fitz
+
+        # Plain text without whitespace preservation is cheaper and enough for keyword matching
+        flags = fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_MEDIABOX_CLIP
+        with fitz.open(pdf_path) as doc:
+            for page in doc:
+                yield page.get_text("text", flags=flags)
+
+    def _classify_pdf_content(self, pdf_path: str, filename: str) -> Tuple[str, Dict]:
+        """
+        Classify a PDF by content while reading pages, stopping once confident.
+
+        The accumulated text is classified after pages 1, 2, 4, 8, ... so total
+        classification work stays linear in the text size. Reading stops once
+        classification_max_chars characters have been collected, and so does
+        OCR of a scanned PDF.
+
+        Returns:
+            (text read so far, content classification result)
+        """
+        max_chars = self.classification_max_chars
+        parts = []
+        length = 0
+        result = None
+        next_check = 1
+        pages = self._pdf_pages(pdf_path)
+
+        try:
+            for page_text in pages:
+                parts.append(page_text)
+                length += len(page_text)
+                if len(parts) == next_check:
+                    next_check *= 2
+                    text = "".join(parts).strip()
+                    result = self.classify_by_content(text[:max_chars], filename)
+                    if result['confidence'] >= self.confidence_threshold:
+                        result['extraction_method'] = 'text_layer'
+                        return text, result
+                if length >= max_chars:
+                    # Text past the cap is never classified, so later pages can't change the result
+                    break
+        except Exception as e:
+            logger.error(f"Error extracting text from PDF {pdf_path}: {e}")
+        finally:
+            pages.close()
+
+        text = "".join(parts).strip()
+        if len(text) < _MIN_PDF_TEXT_CHARS:
+            # No usable text layer: most likely a scanned PDF, so OCR the rendered pages
+            ocr_text = self._ocr_pdf(pdf_path, max_chars)
+            if ocr_text:
+                logger.info(f"No text layer in {filename}, classified from OCR")
+                result = self.classify_by_content(ocr_text[:max_chars], filename)
+                result['extraction_method'] = 'ocr'
+                return ocr_text, result
+
+        if result is None or next_check // 2 != len(parts):
+            result = self.classify_by_content(text[:max_chars], filename)
+        result['extraction_method'] = 'text_layer'
+        return text, result
+
     def extract_text_from_document(self, file_path: str) -> str:
         """Extract text from various document types."""
         try:
             file_ext = Path(file_path).suffix.lower()
-
-            if file_ext in self.image_extensions:
-                return self.extract_text_from_image(file_path)
-            elif file_ext in self.pdf_extensions:
-                return self.extract_text_from_pdf(file_path)
-            elif file_ext in self.office_extensions:
-                # For Office documents, try to extract text if possible
-                # This is a simplified approach - you might want to use python-docx, openpyxl etc.
-                logger.warning(f"Office document text extraction not fully implemented: {file_path}")
-                return ""
-            else:
+            extract = self._ext_dispatch.get(file_ext)
+            if extract is None:
                 logger.warning(f"Unsupported file type: {file_ext}")
                 return ""
+
+            return extract(file_path)
         except Exception as e:
             logger.error(f"Error processing document {file_path}: {e}")
             return ""
 
+    def _extract_text_office(self, file_path: str) -> str:
+        """Office documents are not supported for text extraction yet."""
+        # This is a simplified approach - you might want to use python-docx, openpyxl etc.
+        logger.warning(f"Office document text extraction not fully implemented: {file_path}")
+        return ""
+
     def classify_by_content(self, text: str, filename: str = "") -> Dict:
         """Classify document based on content analysis."""
         if not text:
@@ -201,47 +493,54 @@ class DocumentClassifier:
                 'method': 'content_analysis'
             }
 
+        # Lowered once; keyword and pattern matching below all reuse it
         text_lower = text.lower()
-        scores = {}
-
-        for category, config in self.document_categories.items():
-            if category == 'Dokumen Lainnya':
-                continue
-
-            score = 0
-            keyword_matches = []
-            pattern_matches = []
-
-            # Check keyword matches
-            for keyword in config['keywords']:
-                if keyword in text_lower:
-                    score += 1
-                    keyword_matches.append(keyword)
-
-            # Check pattern matches
-            for pattern in config['patterns']:
-                if re.search(pattern, text_lower):
-                    score += 2  # Give more weight to pattern matches
-                    pattern_matches.append(pattern)
-
-            if score > 0:
-                scores[category] = {
-                    'score': score,
-                    'keywords': keyword_matches,
-                    'patterns': pattern_matches
-                }
+
+        # Scores indexed by category ID; per-category details are only built for the winner
+        scores = array('i', [0]) * len(self._cat_list)
+        found_keywords = set()
+        for _, (keyword, cat_ids) in self._keyword_automaton.iter(text_lower):
+            if keyword not in found_keywords:
+                found_keywords.add(keyword)
+                for cat_id in cat_ids:
+                    scores[cat_id] += 1
+
+        # Check pattern matches
+        pattern_matches = {}
+        for cat_id, category in enumerate(self._cat_list):
+            config = self.document_categories[category]
+            first_hit = config['fused_pattern'].search(text_lower) if config['fused_pattern'] else None
+            if first_hit:
+                first_index = int(first_hit.lastgroup[1:])
+                matched = [
+                    source for i, (pattern, source) in enumerate(config['patterns'])
+                    # Matches can overlap, so patterns other than the first hit are checked on their own
+                    if i == first_index or pattern.search(text_lower)
+                ]
+                scores[cat_id] += 2 * len(matched)  # Give more weight to pattern matches
+                pattern_matches[cat_id] = matched
 
         # Determine best match
-        if scores:
-            best_category = max(scores.keys(), key=lambda k: scores[k]['score'])
-            confidence = min(scores[best_category]['score'] / 5.0, 1.0)  # Normalize to 0-1
+        best_score = max(scores, default=0)
+        if best_score > 0:
+            best_id = scores.index(best_score)
+            best_category = self._cat_list[best_id]
+            keyword_matches = [
+                keyword for keyword in self.document_categories[best_category]['keywords']
+                if keyword in found_keywords
+            ]
+            confidence = min(best_score / 5.0, 1.0)  # Normalize to 0-1
 
             return {
                 'category': best_category,
                 'confidence': confidence,
-                'reason': f"Matched keywords: {', '.join(scores[best_category]['keywords'])}",
+                'reason': f"Matched keywords: {', '.join(keyword_matches)}",
                 'method': 'content_analysis',
-                'details': scores[best_category]
+                'details': {
+                    'score': best_score,
+                    'keywords': keyword_matches,
+                    'patterns': pattern_matches.get(best_id, [])
+                }
             }
         else:
             return {
@@ -253,35 +552,28 @@ class DocumentClassifier:
 
     def classify_by_filename(self, filename: str) -> Dict:
         """Classify document based on filename (fallback method)."""
-        filename_lower = filename.lower()
-
-        # Filename patterns for each category
-        filename_patterns = {
-            'Akta dan SK Kemenkumham': [
-                r'akta.*pendirian', r'akta.*perubahan', r'sk.*kemenkumham',
-                r'pengesahan.*kemenkumham', r'notaris'
-            ],
-            'NIB dan NPWP': [
-                r'nib', r'npwp', r'nomor.*induk.*usaha', r'nomor.*pokok.*wajib.*pajak'
-            ],
-            'KTP Pengurus': [
-                r'ktp.*pengurus', r'ktp.*direktur', r'identitas.*pengurus'
-            ],
-            'Laporan Keuangan': [
-                r'laporan.*keuangan', r'neraca', r'laba.*rugi', r'spt.*tahunan',
-                r'mutasi.*rekening', r'audit'
-            ]
-        }
-
-        for category, patterns in filename_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, filename_lower):
-                    return {
-                        'category': category,
-                        'confidence': 0.7,  # Medium confidence for filename-based
-                        'reason': f"Filename pattern matched: {pattern}",
-                        'method': 'filename_analysis'
-                    }
+        match = self._filename_fused.match(filename)
+        return self._filename_result([self._filename_groups[match.lastgroup]] if match else [])
+
+    def _match_filename(self, filename: str) -> List[Tuple[str, str]]:
+        """Return (category, pattern source) for every category whose filename patterns match."""
+        matches = []
+        for category_re in self._category_filename_res.values():
+            match = category_re.match(filename)
+            if match:
+                matches.append(self._filename_groups[match.lastgroup])
+        return matches
+
+    def _filename_result(self, matches: List[Tuple[str, str]]) -> Dict:
+        """Build the filename classification result from _match_filename output."""
+        if matches:
+            category, source = matches[0]
+            return {
+                'category': category,
+                'confidence': 0.7,  # Medium confidence for filename-based
+                'reason': f"Filename pattern matched: {source}",
+                'method': 'filename_analysis'
+            }
 
         return {
             'category': 'Dokumen Lainnya',
@@ -293,34 +585,126 @@ class DocumentClassifier:
     def classify_document(self, file_path: str) -> Dict:
         """
         Main classification method that combines content and filename analysis.
+        Results are memoized by file content, so unchanged files skip OCR on re-runs.
+        """
+        cache_key, file_size = self._cache_key(file_path)
+        cached = self._get_cached_result(cache_key, file_path)
+        if cached is not None:
+            return cached
+
+        result = self._classify_uncached(file_path, file_size=file_size)
+        self._store_result(cache_key, result)
+        return result
+
+    def _cache_key(self, file_path: str) -> Tuple[Optional[Tuple[str, str]], int]:
+        """
+        Build a result-cache key from the file content and name.
+
+        Small files are hashed in full; large ones use a size/mtime fingerprint.
+        The filename is part of the key because it affects classification.
+
+        Returns:
+            (cache key or None if the file can't be read, file size) -- the size
+            comes from the same stat call, so classification needn't stat again
         """
+        stat = None
         try:
-            filename = os.path.basename(file_path)
+            stat = os.stat(file_path)
+            if stat.st_size <= _HASH_SIZE_LIMIT:
+                digest = hashlib.blake2b(digest_size=16)
+                with open(file_path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                        digest.update(chunk)
+                fingerprint = digest.hexdigest()
+            else:
+                fingerprint = f"{os.path.abspath(file_path)}:{stat.st_size}:{stat.st_mtime_ns}"
+            return (fingerprint, os.path.basename(file_path)), stat.st_size
+        except OSError:
+            return None, stat.st_size if stat is not None else 0
+
+    def _get_cached_result(self, cache_key: Optional[Tuple[str, str]], file_path: str) -> Optional[Dict]:
+        """Return a copy of a cached result re-stamped for file_path, or None."""
+        if cache_key is None or cache_key not in self._result_cache:
+            return None
+
+        result = dict(self._result_cache[cache_key])
+        result.update({
+            'file_path': file_path,
+            'classification_timestamp': self._get_timestamp()
+        })
+        return result
+
+    def _store_result(self, cache_key: Optional[Tuple[str, str]], result: Dict):
+        """Cache a successful classification result."""
+        if cache_key is None or result.get('method') == 'error':
+            return
+
+        self._result_cache[cache_key] = dict(result)
+        if len(self._result_cache) > _RESULT_CACHE_SIZE:
+            del self._result_cache[next(iter(self._result_cache))]
+
+    def _filename_is_decisive(self, filename: str) -> bool:
+        """Whether the filename alone is confident enough to skip text extraction."""
+        filename_matches = self._match_filename(filename)
+        return (len(filename_matches) == 1 and
+                self._filename_result(filename_matches)['confidence'] >= self.confidence_threshold)
+
+    def _classify_uncached(self, file_path: str, text: Optional[str] = None,
+                           file_size: Optional[int] = None) -> Dict:
+        """
+        Classify a document without consulting the result cache.
 
-            # First try content-based classification
-            text = self.extract_text_from_document(file_path)
-            content_result = self.classify_by_content(text, filename)
+        Args:
+            file_path: Path to the document
+            text: Already extracted text (e.g. from a batched OCR request), if any
+            file_size: Size from an earlier stat of the file, if the caller has one
 
-            # If content analysis has low confidence, also check filename
-            if content_result['confidence'] < 0.5:
-                filename_result = self.classify_by_filename(filename)
+        Returns:
+            Classification result. text_length counts the characters actually
+            extracted: PDFs stop reading near classification_max_chars, and a
+            decisive filename skips extraction entirely (text_length 0).
+        """
+        try:
+            filename = os.path.basename(file_path)
 
-                # Choose the result with higher confidence
-                if filename_result['confidence'] > content_result['confidence']:
+            # Filename check is cheap; an unambiguous confident match skips OCR/text extraction
+            filename_matches = self._match_filename(filename)
+            filename_result = self._filename_result(filename_matches)
+            if len(filename_matches) == 1 and filename_result['confidence'] >= self.confidence_threshold:
+                text = ""
+                final_result = filename_result
+                final_result['fallback_method'] = None
+            else:
+                # Otherwise classify by content
+                # Only a prefix of the text is classified
+                max_chars = self.classification_max_chars
+                if text is not None:
+                    content_result = self.classify_by_content(text[:max_chars], filename)
+                elif Path(file_path).suffix.lower() in self.pdf_extensions:
+                    text, content_result = self._classify_pdf_content(file_path, filename)
+                else:
+                    text = self.extract_text_from_document(file_path)
+                    content_result = self.classify_by_content(text[:max_chars], filename)
+
+                # If content analysis has low confidence, fall back to the filename result
+                if content_result['confidence'] < 0.5 and filename_result['confidence'] > content_result['confidence']:
                     final_result = filename_result
                     final_result['fallback_method'] = 'filename_analysis'
                 else:
                     final_result = content_result
                     final_result['fallback_method'] = None
-            else:
-                final_result = content_result
-                final_result['fallback_method'] = None
 
-            # Add additional metadata
+            # Add additional metadata; a single stat call covers both existence and size
+            if file_size is None:
+                try:
+                    file_size = os.stat(file_path).st_size
+                except OSError:
+                    file_size = 0
+
             final_result.update({
                 'file_path': file_path,
                 'filename': filename,
-                'file_size': os.path.getsize(file_path) if os.path.exists(file_path) else 0,
+                'file_size': file_size,
                 'text_length': len(text) if text else 0,
                 'classification_timestamp': self._get_timestamp()
             })
@@ -340,41 +724,116 @@ class DocumentClassifier:
 
     def _get_timestamp(self) -> str:
         """Get current timestamp in ISO format."""
-        from datetime import datetime
         return datetime.now().isoformat()
 
     def batch_classify(self, file_paths: List[str]) -> List[Dict]:
-        """Classify multiple documents."""
-        results = []
-
-        for file_path in file_paths:
-            logger.info(f"Classifying: {file_path}")
-            result = self.classify_document(file_path)
-            results.append(result)
+        """Classify multiple documents, spreading large OCR batches across CPU cores."""
+        if len(file_paths) <= 1:
+            return [self.classify_document(file_path) for file_path in file_paths]
+
+        # Resolve cache hits here; worker processes can't see or fill this cache
+        results = [None] * len(file_paths)
+        pending = []
+        for i, file_path in enumerate(file_paths):
+            cache_key, file_size = self._cache_key(file_path)
+            results[i] = self._get_cached_result(cache_key, file_path)
+            if results[i] is None:
+                pending.append((i, file_path, cache_key, file_size))
+
+        # Google Vision charges a round trip per request, so OCR images in batches here
+        if pending and self.use_google_vision:
+            image_paths = [
+                item[1] for item in pending
+                if Path(item[1]).suffix.lower() in self.image_extensions
+                and not self._filename_is_decisive(os.path.basename(item[1]))
+            ]
+            if len(image_paths) > 1:
+                texts = self._extract_text_google_vision_batch(image_paths)
+                remaining = []
+                for i, file_path, cache_key, file_size in pending:
+                    if file_path in texts:
+                        results[i] = self._classify_uncached(file_path, texts[file_path], file_size)
+                        self._store_result(cache_key, results[i])
+                    else:
+                        remaining.append((i, file_path, cache_key, file_size))
+                pending = remaining
+
+        if pending:
+            logger.info(f"Classifying {len(pending)} documents ({len(file_paths) - len(pending)} cached)")
+
+            # Only images and PDFs (which may be scans) can need OCR, and not when
+            # the filename alone decides; the rest is cheap enough to do here
+            ocr_pending = []
+            in_process = []
+            for item in pending:
+                file_path = item[1]
+                if (Path(file_path).suffix.lower() in self._ocr_extensions
+                        and not self._filename_is_decisive(os.path.basename(file_path))):
+                    ocr_pending.append(item)
+                else:
+                    in_process.append(item)
+            if len(ocr_pending) < _PROCESS_POOL_MIN_FILES:
+                in_process.extend(ocr_pending)
+                ocr_pending = []
+
+            for i, file_path, cache_key, file_size in in_process:
+                results[i] = self._classify_uncached(file_path, file_size=file_size)
+                self._store_result(cache_key, results[i])
+            pending = ocr_pending
+
+        if pending:
+            import pytesseract
+
+            max_workers = min(os.cpu_count() or 1, len(pending))
+            # Bound the number of submitted files so huge batches don't queue every task
+            # (and hold every finished result) at once
+            max_in_flight = max_workers * 2
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(self, pytesseract.pytesseract.tesseract_cmd)
+            ) as executor:
+                in_flight = {}
+                for i, file_path, cache_key, file_size in pending:
+                    if len(in_flight) >= max_in_flight:
+                        self._collect_batch_results(in_flight, results, return_when=FIRST_COMPLETED)
+                    in_flight[executor.submit(_classify_in_worker, file_path, file_size)] = (i, cache_key)
+                self._collect_batch_results(in_flight, results)
 
         return results
 
+    def _collect_batch_results(self, in_flight: Dict, results: List[Optional[Dict]], return_when=None):
+        """Move finished worker results into results and the cache, removing them from in_flight."""
+        if return_when is None:
+            done = list(in_flight)
+        else:
+            done, _ = wait(in_flight, return_when=return_when)
+
+        for future in done:
+            i, cache_key = in_flight.pop(future)
+            results[i] = future.result()
+            self._store_result(cache_key, results[i])
+
     def get_classification_summary(self, results: List[Dict]) -> Dict:
         """Get summary statistics for classification results."""
-        categories = {}
-        confidences = []
+        categories = Counter()
+        methods = set()
+        total_confidence = 0.0
 
+        # Single pass over the results
         for result in results:
-            category = result['category']
-            confidence = result['confidence']
-
-            if category not in categories:
-                categories[category] = 0
-            categories[category] += 1
-            confidences.append(confidence)
+            categories[result['category']] += 1
+            methods.add(result['method'])
+            total_confidence += result['confidence']
 
         return {
             'total_documents': len(results),
-            'categories': categories,
-            'average_confidence': sum(confidences) / len(confidences) if confidences else 0,
-            'classification_methods': list(set(r['method'] for r in results))
+            'categories': dict(categories),
+            'average_confidence': total_confidence / len(results) if results else 0,
+            'classification_methods': list(methods)
         }
 
+
 # Example usage and testing
 if __name__ == "__main__":
     # Initialize classifier
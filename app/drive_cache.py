@@ -0,0 +1,113 @@
+"""
+Persistent cache of Google Drive folder IDs
+Keeps (parent folder, folder name) -> folder ID in SQLite so folder lookups
+survive restarts without a Drive round-trip
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import logging
+from typing import Dict, Optional
+
+from app.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class FolderIdCache:
+    """
+    SQLite-backed folder ID cache with a time-to-live per entry
+    """
+
+    def __init__(self, db_path: Optional[str] = None, ttl_sec: Optional[float] = None):
+        """
+        Open (and create if needed) the cache database
+
+        Args:
+            db_path: Path of the SQLite file (Config.DRIVE_FOLDER_CACHE_PATH if None)
+            ttl_sec: Seconds an entry stays valid (Config.DRIVE_FOLDER_CACHE_TTL_SEC if None)
+        """
+        self.db_path = db_path or Config.DRIVE_FOLDER_CACHE_PATH
+        self.ttl_sec = Config.DRIVE_FOLDER_CACHE_TTL_SEC if ttl_sec is None else ttl_sec
+
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        # One connection shared by all threads, serialized by the lock
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS folder_ids ("
+                "parent_id TEXT NOT NULL, name TEXT NOT NULL, folder_id TEXT NOT NULL, "
+                "updated_at REAL NOT NULL, PRIMARY KEY (parent_id, name))"
+            )
+
+    def get(self, parent_id: str, name: str) -> Optional[str]:
+        """
+        Look up a cached folder ID
+
+        Args:
+            parent_id: ID of the parent folder
+            name: Name of the folder
+
+        Returns:
+            Folder ID if cached and not expired, None otherwise
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT folder_id FROM folder_ids WHERE parent_id = ? AND name = ? AND updated_at >= ?",
+                (parent_id, name, time.time() - self.ttl_sec)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, parent_id: str, name: str, folder_id: str):
+        """
+        Store a folder ID
+
+        Args:
+            parent_id: ID of the parent folder
+            name: Name of the folder
+            folder_id: ID of the folder
+        """
+        self.set_many(parent_id, {name: folder_id})
+
+    def set_many(self, parent_id: str, folders: Dict[str, str]):
+        """
+        Store several folder IDs under the same parent in one transaction
+
+        Args:
+            parent_id: ID of the parent folder
+            folders: Dict mapping folder name to folder ID
+        """
+        if not folders:
+            return
+
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO folder_ids (parent_id, name, folder_id, updated_at) VALUES (?, ?, ?, ?)",
+                    [(parent_id, name, folder_id, now) for name, folder_id in folders.items()]
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to update folder ID cache: {str(e)}")
+
+    def invalidate(self, folder_id: str):
+        """
+        Drop a folder and everything cached beneath it
+
+        Args:
+            folder_id: ID of the folder that no longer exists
+        """
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "DELETE FROM folder_ids WHERE folder_id = ? OR parent_id = ?",
+                    (folder_id, folder_id)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to invalidate folder ID cache: {str(e)}")
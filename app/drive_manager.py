@@ -4,18 +4,128 @@ and document organization according to company and document categories
 """
 
 import os
+import asyncio
+import functools
 import logging
-from typing import Dict, List, Optional, Tuple
-from pathlib import Path
+import mimetypes
+import mmap
+import random
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+import ahocorasick
+import httplib2
+import google_auth_httplib2
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
 from googleapiclient.errors import HttpError
 
 from app.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Google's batch endpoint accepts at most 100 calls per request
+_BATCH_LIMIT = 100
+# Maximum number of (parent, name) -> folder ID entries kept in memory
+_FOLDER_CACHE_SIZE = 1024
+# Files below this size go up in a single multipart request instead of a resumable session
+_SIMPLE_UPLOAD_LIMIT = 5 * 1024 * 1024
+_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+# files().list arguments for shared drive support; omitted when shared drives aren't used
+_SHARED_DRIVE_LIST_ARGS = (
+    {'includeItemsFromAllDrives': True, 'supportsAllDrives': True} if Config.USE_SHARED_DRIVES else {}
+)
+# How long a lookup waits for a company's background subfolder creation
+_SUBFOLDER_WAIT_TIMEOUT = 30
+# Rate limiting and transient server errors are retried with exponential backoff
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# A 429 means the request was rejected unprocessed, so even a create can be resent
+_CREATE_RETRY_STATUSES = frozenset({429})
+_MAX_ATTEMPTS = 3
+_MAX_RETRY_DELAY = 60
+
+
+def _escape_query(value: str) -> str:
+    """Escape a value for use inside a single-quoted Drive query string"""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
+def _execute(request, idempotent: bool = True, **kwargs):
+    """
+    Execute a Drive API request (or batch), retrying transient failures
+
+    Waits 2**attempt seconds plus jitter between attempts, or the server's
+    Retry-After on 429 responses. Creates are only retried on 429: after a 5xx
+    the file may already exist and resending would make a duplicate.
+
+    Args:
+        request: HttpRequest or BatchHttpRequest to execute
+        idempotent: False for requests that create files or folders
+        **kwargs: Passed through to request.execute()
+
+    Returns:
+        The request's response
+    """
+    for attempt in range(_MAX_ATTEMPTS):
+        try:
+            return request.execute(**kwargs)
+        except HttpError as e:
+            status = e.resp.status
+            retry_statuses = _RETRY_STATUSES if idempotent else _CREATE_RETRY_STATUSES
+            if status not in retry_statuses or attempt == _MAX_ATTEMPTS - 1:
+                raise
+
+            retry_after = e.resp.get('retry-after')
+            if status == 429 and retry_after and retry_after.isdigit():
+                delay = int(retry_after)
+            else:
+                delay = 2 ** attempt + random.random()
+            delay = min(delay, _MAX_RETRY_DELAY)
+
+            logger.warning(f"Drive API returned {status}, retrying in {delay:.1f}s ({attempt + 1}/{_MAX_ATTEMPTS})")
+            time.sleep(delay)
+
+
+def _build_category_automaton() -> ahocorasick.Automaton:
+    """
+    Build one automaton over all category keywords
+
+    Each keyword maps to the index of the first category listing it, so the
+    lowest index among the hits is the category a per-category scan would pick.
+    """
+    automaton = ahocorasick.Automaton()
+    for index, keywords in enumerate(Config.DOCUMENT_CATEGORIES.values()):
+        for keyword in keywords:
+            keyword = keyword.lower()
+            if keyword not in automaton:
+                automaton.add_word(keyword, index)
+    automaton.make_automaton()
+    return automaton
+
+
+_CATEGORY_NAMES = tuple(Config.DOCUMENT_CATEGORIES.keys())
+_CATEGORY_AUTOMATON = _build_category_automaton()
+
+
+# Display labels for completeness statuses, as in status.replace('_', ' ').title()
+_STATUS_LABELS = {
+    'complete': 'Complete',
+    'mostly_complete': 'Mostly Complete',
+    'partially_complete': 'Partially Complete',
+    'incomplete': 'Incomplete',
+    'error': 'Error'
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _timestamp_for_second(second: int) -> str:
+    """Format a Unix second as a local ISO timestamp; reports within the same second share it"""
+    return datetime.fromtimestamp(second).isoformat(timespec='seconds')
+
 
 class GoogleDriveManager:
     """
@@ -23,15 +133,49 @@ class GoogleDriveManager:
     file uploads, and document organization
     """
 
+    # Authenticated (credentials, service) pairs shared by all instances, keyed by credentials path
+    _service_cache: ClassVar[Dict[str, Tuple[Any, Any]]] = {}
+    _service_cache_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self):
         """Initialize Google Drive manager with service account"""
         self.service = None
+        self.credentials = None
+        # Resource collections, created once instead of per call
+        self._files = None
+        self._about = None
         self.root_folder_id = Config.GOOGLE_DRIVE_FOLDER_ID
         self.credentials_path = Config.GOOGLE_DRIVE_CREDENTIALS_PATH
+        # LRU cache of folder IDs keyed by (parent_id, folder_name)
+        self._folder_cache: OrderedDict = OrderedDict()
+        # Serializes folder get-or-create so concurrent uploads don't create duplicates
+        self._folder_lock = threading.Lock()
+        # Guards _folder_cache and _pending_subfolders, which upload threads and the
+        # subfolder batch callbacks both update; never held across a Drive request
+        self._cache_lock = threading.Lock()
+        # httplib2 connections aren't thread-safe; each upload thread gets its own
+        self._thread_local = threading.local()
+        # Set once the company folders under the root have been listed into the folder cache
+        self._company_folders_loaded = False
+        # Category subfolders are created in the background: {company_folder_id: Future}
+        self._subfolder_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_subfolders: Dict[str, Future] = {}
+        # time.monotonic() of the last successful upload per company, for cache invalidation
+        self._company_changed_at: Dict[str, float] = {}
         self._authenticate()
 
     def _authenticate(self):
-        """Authenticate with Google Drive using service account"""
+        """
+        Authenticate with Google Drive using service account
+        The credentials and service are built once per credentials file and reused by later instances
+        """
+        with GoogleDriveManager._service_cache_lock:
+            cached = GoogleDriveManager._service_cache.get(self.credentials_path)
+        if cached:
+            self.credentials, self.service = cached
+            self._bind_resources()
+            return
+
         try:
             if not os.path.exists(self.credentials_path):
                 raise FileNotFoundError(f"Service account file not found: {self.credentials_path}")
@@ -43,19 +187,28 @@ class GoogleDriveManager:
             ]
 
             # Load service account credentials
-            credentials = service_account.Credentials.from_service_account_file(
+            self.credentials = service_account.Credentials.from_service_account_file(
                 self.credentials_path,
                 scopes=scopes
             )
 
             # Build the Drive API service
-            self.service = build('drive', 'v3', credentials=credentials)
+            # Bundled discovery document: no network fetch or discovery cache on disk
+            self.service = build('drive', 'v3', credentials=self.credentials, static_discovery=True, cache_discovery=False)
+            with GoogleDriveManager._service_cache_lock:
+                GoogleDriveManager._service_cache.setdefault(self.credentials_path, (self.credentials, self.service))
+            self._bind_resources()
             logger.info("Successfully authenticated with Google Drive")
 
         except Exception as e:
             logger.error(f"Failed to authenticate with Google Drive: {str(e)}")
             raise
 
+    def _bind_resources(self):
+        """Create the files/about resource collections once for the current service"""
+        self._files = self.service.files()
+        self._about = self.service.about()
+
     def create_company_folder(self, company_name: str) -> Optional[str]:
         """
         Create a folder for the company if it doesn't exist
@@ -67,6 +220,13 @@ class GoogleDriveManager:
             Folder ID if successful, None otherwise
         """
         try:
+            # On the first unknown company, list all company folders at once so
+            # later lookups are answered from the cache without a round-trip
+            with self._cache_lock:
+                known = (self.root_folder_id, company_name) in self._folder_cache
+            if not self._company_folders_loaded and not known:
+                self._load_company_folders()
+
             # Check if folder already exists
             existing_folder = self._find_folder(company_name, self.root_folder_id)
             if existing_folder:
@@ -80,17 +240,23 @@ class GoogleDriveManager:
                 'parents': [self.root_folder_id]
             }
 
-            folder = self.service.files().create(
+            folder = _execute(self._files.create(
                 body=folder_metadata,
                 fields='id',
                 supportsAllDrives=True
-            ).execute()
+            ), idempotent=False, http=self._get_thread_http())
 
             folder_id = folder.get('id')
+            self._cache_folder(self.root_folder_id, company_name, folder_id)
             logger.info(f"Created company folder: {company_name} (ID: {folder_id})")
 
-            # Create document category subfolders
-            self._create_category_subfolders(folder_id)
+            # Create document category subfolders in the background; lookups under
+            # this folder wait for them, so the caller can continue right away
+            if self._subfolder_executor is None:
+                self._subfolder_executor = ThreadPoolExecutor(max_workers=4)
+            future = self._subfolder_executor.submit(self._create_category_subfolders, folder_id)
+            with self._cache_lock:
+                self._pending_subfolders[folder_id] = future
 
             return folder_id
 
@@ -101,30 +267,106 @@ class GoogleDriveManager:
             logger.error(f"Unexpected error creating company folder: {str(e)}")
             return None
 
+    def _load_company_folders(self):
+        """
+        Seed the folder cache with the company folders under the root folder
+        Listing stops once the cache is full; companies past that are looked up one by one
+        """
+        self._company_folders_loaded = True
+        try:
+            folders = self._list_all(
+                f"'{_escape_query(self.root_folder_id)}' in parents "
+                f"and mimeType='application/vnd.google-apps.folder' and trashed=false",
+                'nextPageToken, files(id, name)',
+                limit=_FOLDER_CACHE_SIZE
+            )
+        except Exception as e:
+            logger.warning(f"Failed to list company folders: {str(e)}")
+            return
+
+        for folder in folders:
+            self._cache_folder(self.root_folder_id, folder['name'], folder['id'])
+        logger.debug(f"Loaded {len(folders)} company folders")
+
     def _create_category_subfolders(self, parent_folder_id: str):
         """
         Create subfolders for each document category
 
+        All folders are created in a single batch HTTP request instead of one
+        round-trip per category.
+
         Args:
             parent_folder_id: ID of the parent company folder
         """
+        def on_folder_created(request_id, response, exception):
+            if exception is not None:
+                logger.error(f"Failed to create category subfolder {request_id}: {str(exception)}")
+                return
+            self._cache_folder(parent_folder_id, request_id, response.get('id'))
+            logger.debug(f"Created category subfolder: {request_id} (ID: {response.get('id')})")
+
         try:
-            for category in Config.DOCUMENT_CATEGORIES.keys():
-                folder_metadata = {
-                    'name': category,
-                    'mimeType': 'application/vnd.google-apps.folder',
-                    'parents': [parent_folder_id]
-                }
+            categories = list(Config.DOCUMENT_CATEGORIES.keys())
+            for start in range(0, len(categories), _BATCH_LIMIT):
+                batch = self.service.new_batch_http_request(callback=on_folder_created)
+                for category in categories[start:start + _BATCH_LIMIT]:
+                    folder_metadata = {
+                        'name': category,
+                        'mimeType': 'application/vnd.google-apps.folder',
+                        'parents': [parent_folder_id]
+                    }
+                    batch.add(
+                        self._files.create(
+                            body=folder_metadata,
+                            fields='id',
+                            supportsAllDrives=True
+                        ),
+                        request_id=category
+                    )
+                _execute(batch, idempotent=False, http=self._get_thread_http())
 
-                folder = self.service.files().create(
-                    body=folder_metadata,
-                    fields='id'
-                ).execute()
+        except Exception as e:
+            logger.error(f"Failed to create category subfolders: {str(e)}")
+
+    def _is_subfolder_pending(self, parent_id: str, folder_name: str) -> bool:
+        """
+        Check whether a subfolder is still being created in the background
+
+        Args:
+            parent_id: ID of the company folder
+            folder_name: Name of the subfolder
 
-                logger.debug(f"Created category subfolder: {category} (ID: {folder.get('id')})")
+        Returns:
+            True if the unfinished background batch for parent_id will create folder_name
+        """
+        if folder_name not in Config.DOCUMENT_CATEGORIES:
+            return False
+        with self._cache_lock:
+            future = self._pending_subfolders.get(parent_id)
+        return future is not None and not future.done()
+
+    def _wait_for_subfolders(self, parent_id: str, timeout: Optional[float] = _SUBFOLDER_WAIT_TIMEOUT):
+        """
+        Wait for a pending background subfolder creation under parent_id, if any
+
+        Args:
+            parent_id: ID of the company folder
+            timeout: Seconds to wait at most (None waits until it finishes)
+        """
+        with self._cache_lock:
+            future = self._pending_subfolders.get(parent_id)
+        if future is None:
+            return
 
+        try:
+            future.result(timeout=timeout)
         except Exception as e:
-            logger.error(f"Failed to create category subfolders: {str(e)}")
+            logger.warning(f"Category subfolder creation not finished for {parent_id}: {str(e)}")
+
+        if future.done():
+            with self._cache_lock:
+                if self._pending_subfolders.get(parent_id) is future:
+                    del self._pending_subfolders[parent_id]
 
     def upload_file(self, file_path: str, company_name: str) -> Optional[str]:
         """
@@ -137,52 +379,132 @@ class GoogleDriveManager:
         Returns:
             File ID if successful, None otherwise
         """
+        company_folder_id = category_folder_id = None
         try:
-            # Get or create company folder
-            company_folder_id = self.create_company_folder(company_name)
-            if not company_folder_id:
-                raise Exception("Failed to get or create company folder")
-
             # Determine file category
             category = self._categorize_file(file_path)
             if not category:
                 logger.warning(f"Could not categorize file: {file_path}, using 'Uncategorized'")
                 category = "Uncategorized"
 
-            # Get category subfolder ID
-            category_folder_id = self._find_folder(category, company_folder_id)
-            if not category_folder_id:
-                # Create uncategorized folder if category doesn't exist
-                category_folder_id = self._create_folder(category, company_folder_id)
+            with self._folder_lock:
+                # Get or create company folder
+                company_folder_id = self.create_company_folder(company_name)
+                if not company_folder_id:
+                    raise Exception("Failed to get or create company folder")
+
+                # Get category subfolder ID
+                category_folder_id = self._find_folder(category, company_folder_id)
+                if not category_folder_id and self._is_subfolder_pending(company_folder_id, category):
+                    # Still missing only because the background batch hasn't reached it
+                    # yet; creating it here would leave two folders with the same name
+                    self._wait_for_subfolders(company_folder_id, timeout=None)
+                    category_folder_id = self._find_folder(category, company_folder_id)
+                if not category_folder_id:
+                    # Create uncategorized folder if category doesn't exist
+                    category_folder_id = self._create_folder(category, company_folder_id)
 
             # Upload file
-            file_name = Path(file_path).name
+            file_name = os.path.basename(file_path)
             file_metadata = {
                 'name': file_name,
                 'parents': [category_folder_id]
             }
 
-            media = MediaFileUpload(file_path, resumable=True)
-
-            file = self.service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id',
-                supportsAllDrives=True
-            ).execute()
+            # Small files: one multipart POST; large files: resumable upload in chunks
+            mimetype = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+            if os.path.getsize(file_path) < _SIMPLE_UPLOAD_LIMIT:
+                media = MediaFileUpload(file_path, mimetype=mimetype, resumable=False)
+                file = self._create_file(file_metadata, media)
+            else:
+                # Chunks are read straight from a read-only memory map, which is
+                # released (and the file closed) as soon as the upload finishes
+                with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    media = MediaIoBaseUpload(mapped, mimetype=mimetype, chunksize=_UPLOAD_CHUNK_SIZE, resumable=True)
+                    file = self._create_file(file_metadata, media)
 
             file_id = file.get('id')
+            self._company_changed_at[company_name] = time.monotonic()
             logger.info(f"Uploaded file: {file_name} to {company_name}/{category} (ID: {file_id})")
 
             return file_id
 
         except HttpError as e:
             logger.error(f"Failed to upload file {file_path}: {str(e)}")
+            if e.resp.status == 404:
+                # A cached folder was deleted or moved; resolve it from Drive next time
+                for folder_id in (category_folder_id, company_folder_id):
+                    if folder_id:
+                        self._forget_folder(folder_id)
             return None
         except Exception as e:
             logger.error(f"Unexpected error uploading file {file_path}: {str(e)}")
             return None
 
+    def _create_file(self, file_metadata: Dict, media) -> Dict:
+        """
+        Create a file in Drive with the given content
+
+        Args:
+            file_metadata: File resource metadata (name, parents)
+            media: Media upload holding the file content
+
+        Returns:
+            Created file resource with its ID
+        """
+        return _execute(self._files.create(
+            body=file_metadata,
+            media_body=media,
+            fields='id',
+            supportsAllDrives=True
+        ), idempotent=False, http=self._get_thread_http())
+
+    async def upload_files(self, uploads: List[Tuple[str, str]]) -> List[Optional[str]]:
+        """
+        Upload several files concurrently
+
+        Uploads are I/O-bound, so they run on a thread pool with at most
+        Config.MAX_CONCURRENT_UPLOADS in flight at once.
+
+        Args:
+            uploads: List of (file_path, company_name) pairs
+
+        Returns:
+            File IDs in the same order as uploads, None for failed uploads
+        """
+        loop = asyncio.get_running_loop()
+        max_concurrent = max(1, Config.MAX_CONCURRENT_UPLOADS)
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        with ThreadPoolExecutor(max_workers=max_concurrent) as pool:
+            async def upload(file_path: str, company_name: str) -> Optional[str]:
+                async with semaphore:
+                    return await loop.run_in_executor(pool, self.upload_file, file_path, company_name)
+
+            results = await asyncio.gather(
+                *(upload(file_path, company_name) for file_path, company_name in uploads),
+                return_exceptions=True
+            )
+
+        return [None if isinstance(result, BaseException) else result for result in results]
+
+    def _get_thread_http(self):
+        """
+        Get an authorized HTTP connection for the current thread
+
+        Returns:
+            None on the main thread (use the service's own connection), otherwise
+            a connection owned by the calling thread
+        """
+        if threading.current_thread() is threading.main_thread() or self.credentials is None:
+            return None
+
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
+
     def _categorize_file(self, file_path: str) -> Optional[str]:
         """
         Categorize file based on filename and document categories
@@ -193,18 +515,16 @@ class GoogleDriveManager:
         Returns:
             Category name if matched, None otherwise
         """
-        file_name = Path(file_path).name.lower()
+        file_name = os.path.basename(file_path).lower()
 
-        for category, keywords in Config.DOCUMENT_CATEGORIES.items():
-            for keyword in keywords:
-                if keyword.lower() in file_name:
-                    return category
-
-        return None
+        # Single scan of the filename; earliest category wins, as with checking categories in order
+        best_index = min((index for _, index in _CATEGORY_AUTOMATON.iter(file_name)), default=None)
+        return _CATEGORY_NAMES[best_index] if best_index is not None else None
 
     def _find_folder(self, folder_name: str, parent_id: str) -> Optional[str]:
         """
         Find a folder by name within a parent folder
+        Found and created folders are cached, so repeated lookups skip the list query
 
         Args:
             folder_name: Name of the folder to find
@@ -213,19 +533,32 @@ class GoogleDriveManager:
         Returns:
             Folder ID if found, None otherwise
         """
+        self._wait_for_subfolders(parent_id)
+
+        cache_key = (parent_id, folder_name)
+        with self._cache_lock:
+            cached_id = self._folder_cache.get(cache_key)
+            if cached_id is not None:
+                self._folder_cache.move_to_end(cache_key)
+        if cached_id is not None:
+            return cached_id
+
         try:
-            query = f"name='{folder_name}' and '{parent_id}' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false"
+            query = (
+                f"name='{_escape_query(folder_name)}' and '{_escape_query(parent_id)}' in parents "
+                f"and mimeType='application/vnd.google-apps.folder' and trashed=false"
+            )
 
-            response = self.service.files().list(
+            response = _execute(self._files.list(
                 q=query,
                 spaces='drive',
-                includeItemsFromAllDrives=True,
-                supportsAllDrives=True,
-                fields='files(id, name)'
-            ).execute()
+                **_SHARED_DRIVE_LIST_ARGS,
+                fields='files(id)'
+            ), http=self._get_thread_http())
 
             files = response.get('files', [])
             if files:
+                self._cache_folder(parent_id, folder_name, files[0]['id'])
                 return files[0]['id']
 
             return None
@@ -252,18 +585,65 @@ class GoogleDriveManager:
                 'parents': [parent_id]
             }
 
-            folder = self.service.files().create(
+            folder = _execute(self._files.create(
                 body=folder_metadata,
                 fields='id',
                 supportsAllDrives=True
-            ).execute()
+            ), idempotent=False, http=self._get_thread_http())
 
+            self._cache_folder(parent_id, folder_name, folder.get('id'))
             return folder.get('id')
 
         except Exception as e:
             logger.error(f"Failed to create folder {folder_name}: {str(e)}")
             return None
 
+    def company_changed_at(self, company_name: str) -> float:
+        """
+        Get when a file was last uploaded for a company by this manager
+
+        Args:
+            company_name: Name of the company
+
+        Returns:
+            time.monotonic() value of the last upload, 0.0 if none
+        """
+        return self._company_changed_at.get(company_name, 0.0)
+
+    def _cache_folder(self, parent_id: str, folder_name: str, folder_id: Optional[str]):
+        """
+        Remember a folder ID so later lookups skip the list query
+
+        Args:
+            parent_id: ID of the parent folder
+            folder_name: Name of the folder
+            folder_id: ID of the folder
+        """
+        if not folder_id:
+            return
+
+        cache_key = (parent_id, folder_name)
+        with self._cache_lock:
+            self._folder_cache[cache_key] = folder_id
+            self._folder_cache.move_to_end(cache_key)
+            if len(self._folder_cache) > _FOLDER_CACHE_SIZE:
+                self._folder_cache.popitem(last=False)
+
+    def _forget_folder(self, folder_id: str):
+        """
+        Drop a folder that no longer exists, and the subfolders cached under it, from the folder cache
+
+        Args:
+            folder_id: ID of the folder
+        """
+        with self._cache_lock:
+            stale = [
+                cache_key for cache_key, cached_id in self._folder_cache.items()
+                if cached_id == folder_id or cache_key[0] == folder_id
+            ]
+            for cache_key in stale:
+                del self._folder_cache[cache_key]
+
     def check_document_completeness(self, company_name: str) -> Dict[str, List[str]]:
         """
         Check which required documents are present and missing for a company
@@ -279,15 +659,18 @@ class GoogleDriveManager:
             company_folder_id = self._find_folder(company_name, self.root_folder_id)
             if not company_folder_id:
                 logger.warning(f"Company folder not found: {company_name}")
-                return {'present': [], 'missing': Config.REQUIRED_DOCUMENTS.copy()}
+                return {'present': [], 'missing': list(Config.REQUIRED_DOCUMENTS)}
 
             present_docs = []
             missing_docs = []
 
+            # One listing of the company tree instead of a lookup per required document;
+            # only the required documents' folders have their contents listed
+            tree = self._list_tree(company_folder_id, Config.REQUIRED_DOCUMENTS)
+
             for required_doc in Config.REQUIRED_DOCUMENTS:
                 # Check if category folder exists and has files
-                category_folder_id = self._find_folder(required_doc, company_folder_id)
-                if category_folder_id and self._folder_has_files(category_folder_id):
+                if tree.get(required_doc):
                     present_docs.append(required_doc)
                 else:
                     missing_docs.append(required_doc)
@@ -302,7 +685,74 @@ class GoogleDriveManager:
 
         except Exception as e:
             logger.error(f"Error checking document completeness for {company_name}: {str(e)}")
-            return {'present': [], 'missing': Config.REQUIRED_DOCUMENTS.copy()}
+            return {'present': [], 'missing': list(Config.REQUIRED_DOCUMENTS)}
+
+    def _list_tree(self, company_folder_id: str, names: Optional[Tuple[str, ...]] = None) -> Dict[str, List[str]]:
+        """
+        List a company folder's subfolders and their contents in two paginated queries
+        The contents query is skipped entirely when there is no subfolder to look into
+
+        Args:
+            company_folder_id: ID of the company folder
+            names: Only list the contents of subfolders with these names (all if None)
+
+        Returns:
+            Dict mapping subfolder name to the IDs of the items inside it
+        """
+        self._wait_for_subfolders(company_folder_id)
+
+        subfolders = self._list_all(
+            f"'{_escape_query(company_folder_id)}' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false",
+            'nextPageToken, files(id, name)'
+        )
+
+        tree = {}
+        name_by_id = {}
+        for folder in subfolders:
+            self._cache_folder(company_folder_id, folder['name'], folder['id'])
+            if names is None or folder['name'] in names:
+                tree.setdefault(folder['name'], [])
+                name_by_id[folder['id']] = folder['name']
+
+        if name_by_id:
+            parents_clause = " or ".join(f"'{_escape_query(folder_id)}' in parents" for folder_id in name_by_id)
+            children = self._list_all(f"({parents_clause}) and trashed=false", 'nextPageToken, files(id, parents)')
+            for child in children:
+                for parent_id in child.get('parents', []):
+                    if parent_id in name_by_id:
+                        tree[name_by_id[parent_id]].append(child['id'])
+
+        return tree
+
+    def _list_all(self, query: str, fields: str, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Run a files().list query and follow pagination
+
+        Args:
+            query: Drive search query
+            fields: Fields selector, must include nextPageToken
+            limit: Stop after this many results (all if None)
+
+        Returns:
+            All matching file resources, or the first limit of them
+        """
+        files = []
+        page_token = None
+        while True:
+            page_size = 1000 if limit is None else min(1000, limit - len(files))
+            response = _execute(self._files.list(
+                q=query,
+                spaces='drive',
+                **_SHARED_DRIVE_LIST_ARGS,
+                pageSize=page_size,
+                fields=fields,
+                pageToken=page_token
+            ), http=self._get_thread_http())
+
+            files.extend(response.get('files', []))
+            page_token = response.get('nextPageToken')
+            if not page_token or (limit is not None and len(files) >= limit):
+                return files
 
     def _folder_has_files(self, folder_id: str) -> bool:
         """
@@ -315,18 +765,19 @@ class GoogleDriveManager:
             True if folder has files, False otherwise
         """
         try:
-            query = f"'{folder_id}' in parents and trashed=false"
+            query = f"'{_escape_query(folder_id)}' in parents and trashed=false"
 
-            response = self.service.files().list(
+            response = _execute(self._files.list(
                 q=query,
                 spaces='drive',
-                includeItemsFromAllDrives=True,
-                supportsAllDrives=True,
+                **_SHARED_DRIVE_LIST_ARGS,
                 pageSize=1,
                 fields='files(id)'
-            ).execute()
+            ), http=self._get_thread_http())
 
-            return len(response.get('files', [])) > 0
+            # pageSize=1 already returns at most one ID; nextPageToken alone can't prove
+            # existence because a folder with exactly one item has no next page
+            return bool(response.get('files'))
 
         except Exception as e:
             logger.error(f"Error checking folder contents: {str(e)}")
@@ -340,7 +791,7 @@ class GoogleDriveManager:
             True if connection successful, False otherwise
         """
         try:
-            response = self.service.about().get(fields='user').execute()
+            response = _execute(self._about.get(fields='user'))
             user = response.get('user', {})
             logger.info(f"Successfully connected to Google Drive as: {user.get('emailAddress', 'Unknown')}")
             return True
@@ -355,13 +806,20 @@ class DocumentCompletenessChecker:
     Works with GoogleDriveManager to validate required documents
     """
 
+    # Critical documents (most important for legal compliance)
+    _CRITICAL_DOCS = frozenset(('Akta', 'NIB', 'NPWP', 'KTP Pengurus'))
+
     def __init__(self, drive_manager: GoogleDriveManager):
         """Initialize with a GoogleDriveManager instance"""
         self.drive_manager = drive_manager
+        # Recent results: {company_name: (time.monotonic() when checked, result)}
+        self._cache: Dict[str, Tuple[float, Dict]] = {}
+        self._ttl = Config.COMPLETENESS_CACHE_TTL_SEC
 
     def check_completeness(self, company_name: str) -> Dict[str, any]:
         """
         Comprehensive completeness check with detailed results
+        Results are reused for COMPLETENESS_CACHE_TTL_SEC unless a file was uploaded for the company since
 
         Args:
             company_name: Name of the company to check
@@ -369,6 +827,30 @@ class DocumentCompletenessChecker:
         Returns:
             Dict with comprehensive completeness information
         """
+        cached = self._cache.get(company_name)
+        if cached:
+            checked_at, result = cached
+            if (time.monotonic() - checked_at < self._ttl and
+                    checked_at > self.drive_manager.company_changed_at(company_name)):
+                return dict(result)
+
+        checked_at = time.monotonic()
+        result = self._check_completeness(company_name)
+        if result['status'] != 'error':
+            self._cache[company_name] = (checked_at, result)
+        return dict(result)
+
+    def invalidate(self, company_name: str):
+        """
+        Drop the cached completeness result for a company
+
+        Args:
+            company_name: Name of the company
+        """
+        self._cache.pop(company_name, None)
+
+    def _check_completeness(self, company_name: str) -> Dict[str, any]:
+        """Run the completeness check against Drive without the result cache"""
         try:
             # Get basic completeness from drive manager
             completeness = self.drive_manager.check_document_completeness(company_name)
@@ -408,9 +890,8 @@ class DocumentCompletenessChecker:
             return self._get_error_result(company_name, str(e))
 
     def _get_current_timestamp(self) -> str:
-        """Get current timestamp in ISO format"""
-        from datetime import datetime
-        return datetime.now().isoformat()
+        """Get current timestamp in ISO format, at one-second resolution"""
+        return _timestamp_for_second(int(time.time()))
 
     def _get_error_result(self, company_name: str, error_message: str) -> Dict[str, any]:
         """Return error result structure"""
@@ -419,7 +900,7 @@ class DocumentCompletenessChecker:
             'status': 'error',
             'completion_percentage': 0,
             'present_documents': [],
-            'missing_documents': Config.REQUIRED_DOCUMENTS.copy(),
+            'missing_documents': list(Config.REQUIRED_DOCUMENTS),
             'total_required': len(Config.REQUIRED_DOCUMENTS),
             'total_present': 0,
             'total_missing': len(Config.REQUIRED_DOCUMENTS),
@@ -441,10 +922,7 @@ class DocumentCompletenessChecker:
             completeness = self.check_completeness(company_name)
             missing = completeness.get('missing_documents', [])
 
-            # Define critical documents (most important for legal compliance)
-            critical_docs = ['Akta', 'NIB', 'NPWP', 'KTP Pengurus']
-
-            critical_missing = [doc for doc in missing if doc in critical_docs]
+            critical_missing = [doc for doc in missing if doc in self._CRITICAL_DOCS]
             return critical_missing
 
         except Exception as e:
@@ -464,17 +942,24 @@ class DocumentCompletenessChecker:
         try:
             result = self.check_completeness(company_name)
 
-            report = f"📄 Laporan Kelengkapan Dokumen - {company_name}\n"
-            report += f"📊 Status: {result['status'].replace('_', ' ').title()}\n"
-            report += f"📈 Persentase: {result['completion_percentage']}%\n"
-            report += f"✅ Dokumen Ada ({result['total_present']}): {', '.join(result['present_documents']) if result['present_documents'] else 'Tidak ada'}\n"
-            report += f"❌ Dokumen Kurang ({result['total_missing']}): {', '.join(result['missing_documents']) if result['missing_documents'] else 'Tidak ada'}\n"
-            report += f"📅 Periksa: {result['timestamp']}"
+            status = result['status']
+            status_label = _STATUS_LABELS.get(status) or status.replace('_', ' ').title()
+            present = ', '.join(result['present_documents']) or 'Tidak ada'
+            missing = ', '.join(result['missing_documents']) or 'Tidak ada'
+
+            lines = [
+                f"📄 Laporan Kelengkapan Dokumen - {company_name}",
+                f"📊 Status: {status_label}",
+                f"📈 Persentase: {result['completion_percentage']}%",
+                f"✅ Dokumen Ada ({result['total_present']}): {present}",
+                f"❌ Dokumen Kurang ({result['total_missing']}): {missing}",
+                f"📅 Periksa: {result['timestamp']}"
+            ]
 
             if 'error' in result:
-                report += f"\n⚠️ Error: {result['error']}"
+                lines.append(f"⚠️ Error: {result['error']}")
 
-            return report
+            return "\n".join(lines)
 
         except Exception as e:
             logger.error(f"Error generating completeness report: {str(e)}")
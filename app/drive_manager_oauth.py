@@ -5,34 +5,184 @@ Supports user authentication instead of service account
 
 import os
 import logging
-from typing import Dict, List, Optional, Tuple
+import mimetypes
+import threading
+import time
+from typing import Any, ClassVar, Dict, List, Optional, Set, Tuple
 from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
+import httplib2
+import google_auth_httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload, build_http
 from googleapiclient.errors import HttpError
 
 from app.config import Config
+from app.drive_cache import FolderIdCache
+from app.drive_manager import (
+    _CATEGORY_AUTOMATON, _CATEGORY_NAMES, _SIMPLE_UPLOAD_LIMIT, _UPLOAD_CHUNK_SIZE, _escape_query, _execute
+)
 
 logger = logging.getLogger(__name__)
 
+# Calls per batch request; Drive tends to answer larger batches with 500 errors
+_BATCH_LIMIT = 25
+
+
+class _RateLimiter:
+    """Token bucket spacing out Drive writes across threads"""
+
+    def __init__(self, rate: float):
+        """
+        Args:
+            rate: Sustained requests per second, also the burst size
+        """
+        self._rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Wait until a request may be sent"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._rate, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            # A negative balance reserves a future slot for this caller
+            self._tokens -= 1
+            delay = -self._tokens / self._rate if self._tokens < 0 else 0
+
+        if delay:
+            time.sleep(delay)
+
+
+# Drive allows roughly 10 writes per second per user
+_write_limiter = _RateLimiter(max(Config.DRIVE_WRITES_PER_SECOND, 0.1))
+
+# Files at least this large read their next chunk from disk while the current one uploads
+_PREFETCH_UPLOAD_LIMIT = 50 * 1024 * 1024
+# How long a lookup waits for a company's background subfolder creation
+_SUBFOLDER_WAIT_TIMEOUT = 30
+
+
+class _PrefetchingUpload(MediaIoBaseUpload):
+    """
+    Resumable upload that reads the next chunk in the background while the
+    current chunk is being sent, so disk and network work overlap
+    """
+
+    def __init__(self, fd, mimetype: str, chunksize: int):
+        """
+        Args:
+            fd: File opened in binary mode
+            mimetype: MIME type of the file
+            chunksize: Bytes per uploaded chunk
+        """
+        super().__init__(fd, mimetype, chunksize=chunksize, resumable=True)
+        self._fd_lock = threading.Lock()
+        self._reader = ThreadPoolExecutor(max_workers=1)
+        # ((begin, length), Future) of the chunk being read ahead
+        self._prefetch = None
+
+    def has_stream(self):
+        """Report no stream, so the client fetches every chunk through getbytes()"""
+        return False
+
+    def getbytes(self, begin, length):
+        """
+        Get a chunk, from the read-ahead when it matches, and start reading the next one
+
+        Args:
+            begin: Offset from the beginning of the file
+            length: Number of bytes to read
+
+        Returns:
+            The bytes read, shorter than length at end of file
+        """
+        prefetch, self._prefetch = self._prefetch, None
+        if prefetch and prefetch[0] == (begin, length):
+            data = prefetch[1].result()
+        else:
+            # First chunk, or the client re-requested a range after an error
+            data = self._read(begin, length)
+
+        next_begin = begin + len(data)
+        if next_begin < self.size():
+            self._prefetch = ((next_begin, length), self._reader.submit(self._read, next_begin, length))
+        return data
+
+    def _read(self, begin: int, length: int) -> bytes:
+        """Read a byte range from the file"""
+        with self._fd_lock:
+            self._fd.seek(begin)
+            return self._fd.read(length)
+
+    def close(self):
+        """Stop the read-ahead thread"""
+        self._reader.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
 class GoogleDriveManagerOAuth:
     """
     Google Drive Manager using OAuth 2.0 authentication
     """
 
+    # Authenticated (credentials, service) pairs shared by all instances, keyed by token path
+    _service_cache: ClassVar[Dict[str, Tuple[Any, Any]]] = {}
+    _service_cache_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self):
         """Initialize with OAuth authentication"""
         self.service = None
+        self.credentials = None
         self.root_folder_id = Config.GOOGLE_DRIVE_FOLDER_ID
         self.credentials_path = 'credentials.json'
         self.token_path = 'token.json'
+        # Subfolder listings keyed by parent folder ID: {parent_id: {folder_name: folder_id}}
+        self._child_folders: Dict[str, Dict[str, str]] = {}
+        # Resolved company folder IDs, so repeat uploads skip create_company_folder
+        self._company_folder_cache: Dict[str, str] = {}
+        # Last about().get(fields='user') response, shared by test_connection and get_user_info
+        self._about_cache: Optional[Dict] = None
+        # Folder IDs persisted across runs, so known folders need no lookup at all
+        self._folder_id_cache = FolderIdCache()
+        # Serializes folder get-or-create so concurrent uploads don't create duplicates
+        self._folder_lock = threading.Lock()
+        # Guards the in-memory folder caches below, which the background subfolder
+        # creation updates too; taken after _folder_lock, never held across requests
+        self._cache_lock = threading.Lock()
+        # httplib2 connections aren't thread-safe; each worker thread gets its own
+        self._thread_local = threading.local()
+        # Category subfolders are created in the background:
+        # {company_folder_id: (Future, names being created)}
+        self._subfolder_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_subfolders: Dict[str, Tuple[Future, frozenset]] = {}
+        # Folders created by this manager; their listings are complete, so a
+        # name missing from them needs no extra Drive lookup
+        self._created_folders: Set[str] = set()
         self._authenticate()
 
     def _authenticate(self):
-        """Authenticate using OAuth 2.0 flow"""
+        """
+        Authenticate using OAuth 2.0 flow
+        The OAuth flow and service build run once per token file; later instances
+        reuse them and get per-thread connections through _get_thread_http
+        """
+        with GoogleDriveManagerOAuth._service_cache_lock:
+            cached = GoogleDriveManagerOAuth._service_cache.get(self.token_path)
+        if cached:
+            self.credentials, self.service = cached
+            return
+
         try:
             # Define the required scopes
             scopes = [
@@ -69,27 +219,36 @@ class GoogleDriveManagerOAuth:
                     token.write(creds.to_json())
                 logger.info("Saved credentials to token file")
 
-            # Build the Drive API service
-            self.service = build('drive', 'v3', credentials=creds)
+            # Build the Drive API service on one long-lived authorized connection;
+            # httplib2 keeps it open between calls, so requests skip the TLS handshake.
+            # The bundled discovery document avoids fetching it over the network.
+            self.credentials = creds
+            http = google_auth_httplib2.AuthorizedHttp(creds, http=build_http())
+            self.service = build('drive', 'v3', http=http, static_discovery=True, cache_discovery=False)
+            with GoogleDriveManagerOAuth._service_cache_lock:
+                GoogleDriveManagerOAuth._service_cache.setdefault(self.token_path, (self.credentials, self.service))
             logger.info("Successfully authenticated with Google Drive using OAuth")
 
         except Exception as e:
             logger.error(f"Failed to authenticate with Google Drive: {str(e)}")
             raise
 
-    def create_company_folder(self, company_name: str) -> Optional[str]:
+    def create_company_folder(self, company_name: str, exclude_category: Optional[str] = None) -> Optional[str]:
         """
         Create a folder for the company if it doesn't exist
+        Category subfolders of a new company are created in the background,
+        so the folder ID is returned after a single request
 
         Args:
             company_name: Name of the company
+            exclude_category: Category the caller creates itself, left out of the background creation
 
         Returns:
             Folder ID if successful, None otherwise
         """
         try:
             # Check if folder already exists
-            existing_folder = self._find_folder(company_name, self.root_folder_id)
+            existing_folder = self._get_child_folder(company_name, self.root_folder_id)
             if existing_folder:
                 logger.info(f"Company folder already exists: {company_name}")
                 return existing_folder
@@ -101,16 +260,29 @@ class GoogleDriveManagerOAuth:
                 'parents': [self.root_folder_id]
             }
 
-            folder = self.service.files().create(
+            _write_limiter.acquire()
+            folder = _execute(self.service.files().create(
                 body=folder_metadata,
                 fields='id'
-            ).execute()
+            ), idempotent=False, http=self._get_thread_http())
 
             folder_id = folder.get('id')
+            self._remember_folder(self.root_folder_id, company_name, folder_id)
             logger.info(f"Created company folder: {company_name} (ID: {folder_id})")
 
-            # Create document category subfolders
-            self._create_category_subfolders(folder_id)
+            # The new folder is empty; its subfolders are recorded as they're created
+            with self._cache_lock:
+                self._created_folders.add(folder_id)
+                self._child_folders[folder_id] = {}
+
+            # Create document category subfolders in the background; lookups of
+            # those names wait for them, so the caller can continue right away
+            categories = [category for category in Config.DOCUMENT_CATEGORIES if category != exclude_category]
+            if self._subfolder_executor is None:
+                self._subfolder_executor = ThreadPoolExecutor(max_workers=2)
+            future = self._subfolder_executor.submit(self._create_category_subfolders, folder_id, categories)
+            with self._cache_lock:
+                self._pending_subfolders[folder_id] = (future, frozenset(categories))
 
             return folder_id
 
@@ -121,30 +293,48 @@ class GoogleDriveManagerOAuth:
             logger.error(f"Unexpected error creating company folder: {str(e)}")
             return None
 
-    def _create_category_subfolders(self, parent_folder_id: str):
+    def _create_category_subfolders(self, parent_folder_id: str, categories: Optional[List[str]] = None):
         """
         Create subfolders for each document category
+        The folders are created in batch requests instead of one round-trip per category
 
         Args:
             parent_folder_id: ID of the parent company folder
+            categories: Categories to create (all document categories if None)
         """
-        try:
-            for category in Config.DOCUMENT_CATEGORIES.keys():
-                folder_metadata = {
-                    'name': category,
-                    'mimeType': 'application/vnd.google-apps.folder',
-                    'parents': [parent_folder_id]
-                }
-
-                folder = self.service.files().create(
-                    body=folder_metadata,
-                    fields='id'
-                ).execute()
+        def on_folder_created(request_id, response, exception):
+            if exception is not None:
+                logger.error(f"Failed to create category subfolder {request_id}: {str(exception)}")
+                # The folder may exist anyway, so later lookups must ask Drive
+                with self._cache_lock:
+                    self._created_folders.discard(parent_folder_id)
+                return
+            self._remember_folder(parent_folder_id, request_id, response.get('id'))
+            logger.debug(f"Created category subfolder: {request_id} (ID: {response.get('id')})")
 
-                logger.debug(f"Created category subfolder: {category} (ID: {folder.get('id')})")
+        try:
+            if categories is None:
+                categories = list(Config.DOCUMENT_CATEGORIES.keys())
+            for start in range(0, len(categories), _BATCH_LIMIT):
+                batch = self.service.new_batch_http_request(callback=on_folder_created)
+                for category in categories[start:start + _BATCH_LIMIT]:
+                    folder_metadata = {
+                        'name': category,
+                        'mimeType': 'application/vnd.google-apps.folder',
+                        'parents': [parent_folder_id]
+                    }
+                    # Every call in the batch counts against the write rate
+                    _write_limiter.acquire()
+                    batch.add(
+                        self.service.files().create(body=folder_metadata, fields='id'),
+                        request_id=category
+                    )
+                _execute(batch, idempotent=False, http=self._get_thread_http())
 
         except Exception as e:
             logger.error(f"Failed to create category subfolders: {str(e)}")
+            with self._cache_lock:
+                self._created_folders.discard(parent_folder_id)
 
     def upload_file(self, file_path: str, company_name: str) -> Optional[str]:
         """
@@ -157,23 +347,41 @@ class GoogleDriveManagerOAuth:
         Returns:
             File ID if successful, None otherwise
         """
+        company_folder_id = category_folder_id = None
         try:
-            # Get or create company folder
-            company_folder_id = self.create_company_folder(company_name)
-            if not company_folder_id:
-                raise Exception("Failed to get or create company folder")
-
             # Determine file category
             category = self._categorize_file(file_path)
             if not category:
                 logger.warning(f"Could not categorize file: {file_path}, using 'Uncategorized'")
                 category = "Uncategorized"
 
-            # Get category subfolder ID
-            category_folder_id = self._find_folder(category, company_folder_id)
-            if not category_folder_id:
-                # Create uncategorized folder if category doesn't exist
-                category_folder_id = self._create_folder(category, company_folder_id)
+            with self._folder_lock:
+                # Get or create company folder; when it isn't cached anywhere, the
+                # company and category folders are looked up together in one batch
+                with self._cache_lock:
+                    company_folder_id = self._company_folder_cache.get(company_name)
+                if not company_folder_id:
+                    company_folder_id, category_folder_id = self._resolve_upload_folders(company_name, category)
+                if not company_folder_id:
+                    # A new company's other subfolders are created in the background
+                    # while this file's category folder is created below
+                    company_folder_id = self.create_company_folder(company_name, exclude_category=category)
+                    if not company_folder_id:
+                        raise Exception("Failed to get or create company folder")
+                with self._cache_lock:
+                    self._company_folder_cache[company_name] = company_folder_id
+
+                # Get category subfolder ID
+                if not category_folder_id:
+                    category_folder_id = self._get_child_folder(category, company_folder_id)
+                if not category_folder_id and self._is_subfolder_pending(company_folder_id, category):
+                    # Still missing only because the background batch hasn't reached it
+                    # yet; creating it here would leave two folders with the same name
+                    self._wait_for_subfolders(company_folder_id, category, timeout=None)
+                    category_folder_id = self._get_child_folder(category, company_folder_id)
+                if not category_folder_id:
+                    # Create uncategorized folder if category doesn't exist
+                    category_folder_id = self._create_folder(category, company_folder_id)
 
             # Upload file
             file_name = Path(file_path).name
@@ -182,13 +390,18 @@ class GoogleDriveManagerOAuth:
                 'parents': [category_folder_id]
             }
 
-            media = MediaFileUpload(file_path, resumable=True)
-
-            file = self.service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id'
-            ).execute()
+            # Small files: one multipart POST; large files: resumable upload in large chunks,
+            # reading ahead from disk for the largest ones
+            file_size = os.path.getsize(file_path)
+            if file_size < _SIMPLE_UPLOAD_LIMIT:
+                file = self._create_file(file_metadata, MediaFileUpload(file_path, resumable=False))
+            elif file_size < _PREFETCH_UPLOAD_LIMIT:
+                media = MediaFileUpload(file_path, resumable=True, chunksize=_UPLOAD_CHUNK_SIZE)
+                file = self._create_file(file_metadata, media)
+            else:
+                mimetype = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+                with open(file_path, 'rb') as f, _PrefetchingUpload(f, mimetype, _UPLOAD_CHUNK_SIZE) as media:
+                    file = self._create_file(file_metadata, media)
 
             file_id = file.get('id')
             logger.info(f"Uploaded file: {file_name} to {company_name}/{category} (ID: {file_id})")
@@ -197,11 +410,124 @@ class GoogleDriveManagerOAuth:
 
         except HttpError as e:
             logger.error(f"Failed to upload file {file_path}: {str(e)}")
+            if e.resp.status == 404:
+                # A cached folder was deleted or moved; resolve it from Drive next time
+                for folder_id in (category_folder_id, company_folder_id):
+                    if folder_id:
+                        self._forget_folder(folder_id)
             return None
         except Exception as e:
             logger.error(f"Unexpected error uploading file {file_path}: {str(e)}")
             return None
 
+    def _resolve_upload_folders(self, company_name: str, category: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Find a company folder and its category subfolder in a single batch request
+
+        Drive queries can't be nested, so the category folder is looked up by name
+        across all parents and matched against the company folder afterwards.
+        Already-cached company folders are returned without any request.
+
+        Args:
+            company_name: Name of the company
+            category: Name of the category subfolder
+
+        Returns:
+            Tuple of (company folder ID, category folder ID), None for any not found
+        """
+        company_folder_id = self._folder_id_cache.get(self.root_folder_id, company_name)
+        if not company_folder_id:
+            with self._cache_lock:
+                company_folder_id = self._child_folders.get(self.root_folder_id, {}).get(company_name)
+        if company_folder_id:
+            return company_folder_id, None
+
+        responses = {}
+
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                logger.warning(f"Folder lookup for {request_id} failed: {str(exception)}")
+                return
+            responses[request_id] = response
+
+        folder_clause = "mimeType='application/vnd.google-apps.folder' and trashed=false"
+        batch = self.service.new_batch_http_request(callback=on_response)
+        batch.add(
+            self.service.files().list(
+                q=f"name='{_escape_query(company_name)}' and '{_escape_query(self.root_folder_id)}' in parents and {folder_clause}",
+                spaces='drive',
+                pageSize=1,
+                fields='files(id)'
+            ),
+            request_id='company'
+        )
+        batch.add(
+            self.service.files().list(
+                q=f"name='{_escape_query(category)}' and {folder_clause}",
+                spaces='drive',
+                pageSize=1000,
+                fields='files(id, parents)'
+            ),
+            request_id='category'
+        )
+        try:
+            _execute(batch, http=self._get_thread_http())
+        except Exception as e:
+            # The regular one-by-one lookups still work without the batch
+            logger.warning(f"Batch folder lookup failed for {company_name}: {str(e)}")
+            return None, None
+
+        companies = responses.get('company', {}).get('files', [])
+        if not companies:
+            return None, None
+
+        company_folder_id = companies[0]['id']
+        self._remember_folder(self.root_folder_id, company_name, company_folder_id)
+
+        # Only the first page of same-named folders is checked; a miss falls back to a direct lookup
+        category_folder_id = next(
+            (folder['id'] for folder in responses.get('category', {}).get('files', [])
+             if company_folder_id in folder.get('parents', [])),
+            None
+        )
+        self._remember_folder(company_folder_id, category, category_folder_id)
+        return company_folder_id, category_folder_id
+
+    def _create_file(self, file_metadata: Dict, media) -> Dict:
+        """
+        Create a file in Drive with the given content
+
+        Args:
+            file_metadata: File resource metadata (name, parents)
+            media: Media upload holding the file content
+
+        Returns:
+            Created file resource with its ID
+        """
+        _write_limiter.acquire()
+        return _execute(self.service.files().create(
+            body=file_metadata,
+            media_body=media,
+            fields='id'
+        ), idempotent=False, http=self._get_thread_http())
+
+    def _get_thread_http(self):
+        """
+        Get an authorized HTTP connection for the current thread
+
+        Returns:
+            None on the main thread (use the service's own connection), otherwise
+            a connection owned by the calling thread
+        """
+        if threading.current_thread() is threading.main_thread() or self.credentials is None:
+            return None
+
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
+
     def _categorize_file(self, file_path: str) -> Optional[str]:
         """
         Categorize file based on filename and document categories
@@ -212,14 +538,12 @@ class GoogleDriveManagerOAuth:
         Returns:
             Category name if matched, None otherwise
         """
-        file_name = Path(file_path).name.lower()
-
-        for category, keywords in Config.DOCUMENT_CATEGORIES.items():
-            for keyword in keywords:
-                if keyword.lower() in file_name:
-                    return category
+        file_name = os.path.basename(file_path).lower()
 
-        return None
+        # Single scan over the shared keyword automaton; earliest category wins,
+        # as with checking categories in order
+        best_index = min((index for _, index in _CATEGORY_AUTOMATON.iter(file_name)), default=None)
+        return _CATEGORY_NAMES[best_index] if best_index is not None else None
 
     def _find_folder(self, folder_name: str, parent_id: str) -> Optional[str]:
         """
@@ -232,17 +556,25 @@ class GoogleDriveManagerOAuth:
         Returns:
             Folder ID if found, None otherwise
         """
+        cached_id = self._folder_id_cache.get(parent_id, folder_name)
+        if cached_id:
+            return cached_id
+
         try:
-            query = f"name='{folder_name}' and '{parent_id}' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false"
+            query = (
+                f"name='{_escape_query(folder_name)}' and '{_escape_query(parent_id)}' in parents "
+                f"and mimeType='application/vnd.google-apps.folder' and trashed=false"
+            )
 
-            response = self.service.files().list(
+            response = _execute(self.service.files().list(
                 q=query,
                 spaces='drive',
-                fields='files(id, name)'
-            ).execute()
+                fields='files(id)'
+            ), http=self._get_thread_http())
 
             files = response.get('files', [])
             if files:
+                self._folder_id_cache.set(parent_id, folder_name, files[0]['id'])
                 return files[0]['id']
 
             return None
@@ -269,17 +601,180 @@ class GoogleDriveManagerOAuth:
                 'parents': [parent_id]
             }
 
-            folder = self.service.files().create(
+            _write_limiter.acquire()
+            folder = _execute(self.service.files().create(
                 body=folder_metadata,
                 fields='id'
-            ).execute()
+            ), idempotent=False, http=self._get_thread_http())
 
+            self._remember_folder(parent_id, folder_name, folder.get('id'))
             return folder.get('id')
 
         except Exception as e:
             logger.error(f"Failed to create folder {folder_name}: {str(e)}")
             return None
 
+    def _list_child_folders(self, parent_id: str) -> Dict[str, str]:
+        """
+        List all subfolders of a folder in one paginated query
+        The listing is kept per parent, so later lookups are answered locally
+
+        Args:
+            parent_id: ID of the parent folder
+
+        Returns:
+            Dict mapping folder name to folder ID (a snapshot of the cached listing)
+        """
+        with self._cache_lock:
+            if parent_id in self._child_folders:
+                return dict(self._child_folders[parent_id])
+
+        query = f"'{_escape_query(parent_id)}' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false"
+
+        folders = {}
+        page_token = None
+        while True:
+            response = _execute(self.service.files().list(
+                q=query,
+                spaces='drive',
+                pageSize=1000,
+                fields='nextPageToken, files(id, name)',
+                pageToken=page_token
+            ), http=self._get_thread_http())
+
+            for folder in response.get('files', []):
+                folders.setdefault(folder['name'], folder['id'])
+
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                break
+
+        self._folder_id_cache.set_many(parent_id, folders)
+        with self._cache_lock:
+            # Keep anything recorded while the listing was being fetched
+            listing = self._child_folders.setdefault(parent_id, {})
+            for name, folder_id in folders.items():
+                listing.setdefault(name, folder_id)
+            return dict(listing)
+
+    def _is_subfolder_pending(self, parent_id: str, folder_name: str) -> bool:
+        """
+        Check whether a subfolder is still being created in the background
+
+        Args:
+            parent_id: ID of the company folder
+            folder_name: Name of the subfolder
+
+        Returns:
+            True if a background creation that includes folder_name hasn't finished
+        """
+        with self._cache_lock:
+            pending = self._pending_subfolders.get(parent_id)
+        return pending is not None and folder_name in pending[1] and not pending[0].done()
+
+    def _wait_for_subfolders(self, parent_id: str, folder_name: Optional[str] = None,
+                             timeout: Optional[float] = _SUBFOLDER_WAIT_TIMEOUT) -> bool:
+        """
+        Wait for a pending background subfolder creation under parent_id, if any
+
+        Args:
+            parent_id: ID of the company folder
+            folder_name: Only wait if this subfolder is among those being created (any if None)
+            timeout: Seconds to wait at most (no limit if None)
+
+        Returns:
+            False if the creation was still running when the wait timed out, True otherwise
+        """
+        with self._cache_lock:
+            pending = self._pending_subfolders.get(parent_id)
+        if pending is None:
+            return True
+
+        future, names = pending
+        if folder_name is not None and folder_name not in names:
+            return True
+
+        try:
+            future.result(timeout=timeout)
+        except Exception as e:
+            logger.warning(f"Category subfolder creation not finished for {parent_id}: {str(e)}")
+
+        if not future.done():
+            return False
+
+        with self._cache_lock:
+            self._pending_subfolders.pop(parent_id, None)
+        return True
+
+    def _get_child_folder(self, folder_name: str, parent_id: str) -> Optional[str]:
+        """
+        Find a subfolder by name using the parent's folder listing
+        Names missing from the listing are looked up once more in case the
+        folder was created elsewhere after the listing was taken, unless this
+        manager created the parent itself and its subfolders are all in place
+
+        Args:
+            folder_name: Name of the folder to find
+            parent_id: ID of the parent folder
+
+        Returns:
+            Folder ID if found, None otherwise
+        """
+        cached_id = self._folder_id_cache.get(parent_id, folder_name)
+        if cached_id:
+            return cached_id
+
+        subfolders_ready = self._wait_for_subfolders(parent_id, folder_name)
+
+        try:
+            folder_id = self._list_child_folders(parent_id).get(folder_name)
+        except Exception as e:
+            logger.error(f"Error listing subfolders of {parent_id}: {str(e)}")
+            folder_id = None
+
+        with self._cache_lock:
+            listing_complete = parent_id in self._created_folders
+        # After a wait timeout the background batch may have created the folder
+        # without recording it yet, so ask Drive rather than create a duplicate
+        if not folder_id and (not listing_complete or not subfolders_ready):
+            folder_id = self._find_folder(folder_name, parent_id)
+            self._remember_folder(parent_id, folder_name, folder_id)
+        return folder_id
+
+    def _remember_folder(self, parent_id: str, folder_name: str, folder_id: Optional[str]):
+        """
+        Record a folder in the persistent cache and in its parent's listing, if loaded
+
+        Args:
+            parent_id: ID of the parent folder
+            folder_name: Name of the folder
+            folder_id: ID of the folder
+        """
+        if not folder_id:
+            return
+
+        self._folder_id_cache.set(parent_id, folder_name, folder_id)
+        with self._cache_lock:
+            if parent_id in self._child_folders:
+                self._child_folders[parent_id].setdefault(folder_name, folder_id)
+
+    def _forget_folder(self, folder_id: str):
+        """
+        Drop a folder that no longer exists from all caches
+
+        Args:
+            folder_id: ID of the folder
+        """
+        self._folder_id_cache.invalidate(folder_id)
+        with self._cache_lock:
+            self._child_folders.pop(folder_id, None)
+            self._created_folders.discard(folder_id)
+            for name in [name for name, cached_id in self._company_folder_cache.items() if cached_id == folder_id]:
+                del self._company_folder_cache[name]
+            for folders in self._child_folders.values():
+                for name in [name for name, cached_id in folders.items() if cached_id == folder_id]:
+                    del folders[name]
+
     def check_document_completeness(self, company_name: str) -> Dict[str, List[str]]:
         """
         Check which required documents are present and missing for a company
@@ -292,18 +787,26 @@ class GoogleDriveManagerOAuth:
         """
         try:
             # Get company folder ID
-            company_folder_id = self._find_folder(company_name, self.root_folder_id)
+            company_folder_id = self._get_child_folder(company_name, self.root_folder_id)
             if not company_folder_id:
                 logger.warning(f"Company folder not found: {company_name}")
-                return {'present': [], 'missing': Config.REQUIRED_DOCUMENTS.copy()}
+                return {'present': [], 'missing': list(Config.REQUIRED_DOCUMENTS)}
 
             present_docs = []
             missing_docs = []
 
+            # Look the required category folders up in the company's folder listing,
+            # then check their contents in batch requests instead of one call per document
+            self._wait_for_subfolders(company_folder_id)
+            subfolders = self._list_child_folders(company_folder_id)
+            category_folders = {
+                name: subfolders[name] for name in Config.REQUIRED_DOCUMENTS if name in subfolders
+            }
+            non_empty_folders = self._folders_with_files(category_folders)
+
             for required_doc in Config.REQUIRED_DOCUMENTS:
                 # Check if category folder exists and has files
-                category_folder_id = self._find_folder(required_doc, company_folder_id)
-                if category_folder_id and self._folder_has_files(category_folder_id):
+                if required_doc in non_empty_folders:
                     present_docs.append(required_doc)
                 else:
                     missing_docs.append(required_doc)
@@ -318,7 +821,43 @@ class GoogleDriveManagerOAuth:
 
         except Exception as e:
             logger.error(f"Error checking document completeness for {company_name}: {str(e)}")
-            return {'present': [], 'missing': Config.REQUIRED_DOCUMENTS.copy()}
+            return {'present': [], 'missing': list(Config.REQUIRED_DOCUMENTS)}
+
+    def _folders_with_files(self, folders: Dict[str, str]) -> Set[str]:
+        """
+        Check several folders for contents using batch requests
+
+        Args:
+            folders: Dict mapping category name to folder ID
+
+        Returns:
+            Set of category names whose folder has at least one file
+        """
+        non_empty = set()
+
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                logger.error(f"Error checking folder contents for {request_id}: {str(exception)}")
+                return
+            if response.get('files'):
+                non_empty.add(request_id)
+
+        items = list(folders.items())
+        for start in range(0, len(items), _BATCH_LIMIT):
+            batch = self.service.new_batch_http_request(callback=on_response)
+            for name, folder_id in items[start:start + _BATCH_LIMIT]:
+                batch.add(
+                    self.service.files().list(
+                        q=f"'{_escape_query(folder_id)}' in parents and trashed=false",
+                        spaces='drive',
+                        pageSize=1,
+                        fields='files(id)'
+                    ),
+                    request_id=name
+                )
+            _execute(batch, http=self._get_thread_http())
+
+        return non_empty
 
     def _folder_has_files(self, folder_id: str) -> bool:
         """
@@ -331,14 +870,14 @@ class GoogleDriveManagerOAuth:
             True if folder has files, False otherwise
         """
         try:
-            query = f"'{folder_id}' in parents and trashed=false"
+            query = f"'{_escape_query(folder_id)}' in parents and trashed=false"
 
-            response = self.service.files().list(
+            response = _execute(self.service.files().list(
                 q=query,
                 spaces='drive',
                 pageSize=1,
                 fields='files(id)'
-            ).execute()
+            ), http=self._get_thread_http())
 
             return len(response.get('files', [])) > 0
 
@@ -354,8 +893,9 @@ class GoogleDriveManagerOAuth:
             True if connection successful, False otherwise
         """
         try:
-            response = self.service.about().get(fields='user').execute()
-            user = response.get('user', {})
+            # Always a live request; the response is kept for get_user_info
+            self._about_cache = _execute(self.service.about().get(fields='user'))
+            user = self._about_cache.get('user', {})
             logger.info(f"Successfully connected to Google Drive as: {user.get('emailAddress', 'Unknown')}")
             return True
         except Exception as e:
@@ -370,8 +910,9 @@ class GoogleDriveManagerOAuth:
             Dict with user information
         """
         try:
-            response = self.service.about().get(fields='user').execute()
-            user = response.get('user', {})
+            if self._about_cache is None:
+                self._about_cache = _execute(self.service.about().get(fields='user'))
+            user = self._about_cache.get('user', {})
             return {
                 'email': user.get('emailAddress', 'Unknown'),
                 'name': user.get('displayName', 'Unknown'),
@@ -393,34 +934,39 @@ class GoogleDriveManagerOAuth:
         """
         try:
             # Get company folder ID
-            company_folder_id = self._find_folder(company_name, self.root_folder_id)
+            company_folder_id = self._get_child_folder(company_name, self.root_folder_id)
             if not company_folder_id:
                 logger.warning(f"Company folder not found: {company_name}")
                 return []
 
-            # Get all files in company folder and subfolders
-            query = f"'{company_folder_id}' in parents and trashed=false"
+            # Get all files in company folder and subfolders; folders are excluded by the query
+            query = (
+                f"'{_escape_query(company_folder_id)}' in parents and trashed=false "
+                f"and mimeType != 'application/vnd.google-apps.folder'"
+            )
 
-            response = self.service.files().list(
-                q=query,
-                spaces='drive',
-                fields='files(id, name, parents, mimeType)'
-            ).execute()
-
-            files = response.get('files', [])
             company_files = []
-
-            for file in files:
-                # Skip folders, only include files
-                if file.get('mimeType') == 'application/vnd.google-apps.folder':
-                    continue
-
-                company_files.append({
-                    'id': file.get('id'),
-                    'name': file.get('name'),
-                    'parents': file.get('parents', []),
-                    'mimeType': file.get('mimeType', 'unknown')
-                })
+            page_token = None
+            while True:
+                response = _execute(self.service.files().list(
+                    q=query,
+                    spaces='drive',
+                    pageSize=1000,
+                    fields='nextPageToken, files(id, name, parents, mimeType)',
+                    pageToken=page_token
+                ), http=self._get_thread_http())
+
+                for file in response.get('files', []):
+                    company_files.append({
+                        'id': file.get('id'),
+                        'name': file.get('name'),
+                        'parents': file.get('parents', []),
+                        'mimeType': file.get('mimeType', 'unknown')
+                    })
+
+                page_token = response.get('nextPageToken')
+                if not page_token:
+                    break
 
             logger.info(f"Found {len(company_files)} files for company: {company_name}")
             return company_files
@@ -5,8 +5,12 @@ Coordinates file watching, AI parsing, Google Drive operations, and notification
 
 import os
 import sys
+import json
+import queue
 import logging
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -49,6 +53,13 @@ class LegalDocumentAutomation:
         self.notification_manager = None
         self.watcher = None
         self.is_running = False
+        # Only one worker at a time may prompt the user for instructions
+        self._prompt_lock = threading.Lock()
+        # Monitor mode: files needing a prompt wait here for a single prompting thread,
+        # files with sidecar instructions go straight to the upload pool
+        self._prompt_queue: Optional[queue.Queue] = None
+        self._prompt_thread: Optional[threading.Thread] = None
+        self._monitor_executor: Optional[ThreadPoolExecutor] = None
 
     def initialize(self) -> bool:
         """
@@ -98,16 +109,21 @@ class LegalDocumentAutomation:
             logger.error(f"❌ System initialization failed: {str(e)}")
             return False
 
-    def get_user_command(self) -> Optional[dict]:
+    def get_user_command(self, file_path: Optional[str] = None) -> Optional[dict]:
         """
         Get user command input for processing a file
 
+        Args:
+            file_path: File the instruction is for, shown in the prompt
+
         Returns:
             Dict with company and job_type, or None if failed
         """
         print("\n" + "="*60)
         print("🤖 AI Legal Document Automation System")
         print("="*60)
+        if file_path:
+            print(f"📄 File: {Path(file_path).name}")
         print("Masukkan instruksi untuk dokumen yang baru ditambahkan:")
         print("Contoh: 'Ini untuk PT Jaminan Nasional Indonesia, pekerjaan pengurusan izin PPIU'")
         print("-"*60)
@@ -148,7 +164,8 @@ class LegalDocumentAutomation:
 
             # Get user command if not provided
             if not user_command:
-                user_command = self.get_user_command()
+                with self._prompt_lock:
+                    user_command = self.get_user_command(file_path)
                 if not user_command:
                     logger.error("No valid user command provided")
                     return False
@@ -204,13 +221,21 @@ class LegalDocumentAutomation:
         try:
             logger.info("Starting folder monitoring mode...")
 
+            self._prompt_queue = queue.Queue()
+            self._prompt_thread = threading.Thread(
+                target=self._prompt_worker, args=(self._prompt_queue,), name="prompt-worker", daemon=True
+            )
+            self._prompt_thread.start()
+            self._monitor_executor = ThreadPoolExecutor(max_workers=max(1, Config.MAX_CONCURRENT_UPLOADS))
+
             def on_file_created(file_path: str):
-                """Handle new file creation"""
+                """Handle new file creation without blocking the watcher"""
                 logger.info(f"New file detected: {file_path}")
-                try:
-                    self.process_file(file_path)
-                except Exception as e:
-                    logger.error(f"Failed to process new file {file_path}: {str(e)}")
+                user_command = self.load_sidecar_command(file_path)
+                if user_command:
+                    self._monitor_executor.submit(self._process_file_safely, file_path, user_command)
+                else:
+                    self._prompt_queue.put(file_path)
 
             # Initialize watcher
             self.watcher = LegalDocumentWatcher(on_file_created)
@@ -226,8 +251,76 @@ class LegalDocumentAutomation:
         finally:
             self.stop()
 
-    def process_existing_files(self):
-        """Process all existing files in the watch folder"""
+    def load_sidecar_command(self, file_path: str) -> Optional[dict]:
+        """
+        Read instructions for a file from its '<file>.meta.json' sidecar, if present
+
+        The sidecar holds either 'company' and 'job_type' directly, or an
+        'instruction' text that is parsed like typed input.
+
+        Args:
+            file_path: Path to the document
+
+        Returns:
+            Dict with company and job_type, or None if there is no usable sidecar
+        """
+        sidecar_path = f"{file_path}.meta.json"
+        if not os.path.exists(sidecar_path):
+            return None
+
+        try:
+            with open(sidecar_path, 'r', encoding='utf-8') as f:
+                metadata = json.load(f)
+
+            if metadata.get('company'):
+                logger.info(f"Using sidecar instructions for {file_path}")
+                return {
+                    'company': metadata['company'],
+                    'job_type': metadata.get('job_type', 'Unknown')
+                }
+            if metadata.get('instruction'):
+                logger.info(f"Parsing sidecar instruction for {file_path}")
+                return self.ai_parser.extract_company_and_job(metadata['instruction'])
+
+            logger.warning(f"Sidecar has no company or instruction: {sidecar_path}")
+            return None
+
+        except Exception as e:
+            logger.error(f"Error reading sidecar {sidecar_path}: {str(e)}")
+            return None
+
+    def _prompt_worker(self, prompt_queue: queue.Queue):
+        """
+        Process queued files that need typed instructions, one at a time
+
+        Args:
+            prompt_queue: Queue of file paths; None stops the worker
+        """
+        while True:
+            file_path = prompt_queue.get()
+            if file_path is None:
+                break
+            self._process_file_safely(file_path)
+
+    def _process_file_safely(self, file_path: str, user_command: Optional[dict] = None):
+        """Process a file from a background thread, logging instead of raising"""
+        try:
+            self.process_file(file_path, user_command)
+        except Exception as e:
+            logger.error(f"Failed to process new file {file_path}: {str(e)}")
+
+    def process_existing_files(self, max_workers: Optional[int] = None):
+        """
+        Process all existing files in the watch folder
+        The directory scan feeds a bounded queue read by upload worker threads,
+        so scanning overlaps uploads and memory stays flat for large folders.
+        Instructions come from each file's sidecar or, failing that, are asked
+        for on the scanning thread one file at a time, so every prompt names its
+        file and workers never prompt.
+
+        Args:
+            max_workers: Maximum concurrent uploads (Config.MAX_CONCURRENT_UPLOADS if None)
+        """
         try:
             watch_folder = Path(Config.WATCH_FOLDER)
             if not watch_folder.exists():
@@ -241,12 +334,50 @@ class LegalDocumentAutomation:
                 '.jpg', '.jpeg', '.png', '.tiff', '.tif'
             }
 
-            files_processed = 0
-            for file_path in watch_folder.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in supported_extensions:
-                    logger.info(f"Found existing file: {file_path}")
-                    if self.process_file(str(file_path)):
-                        files_processed += 1
+            max_workers = max(1, max_workers or Config.MAX_CONCURRENT_UPLOADS)
+            file_queue: queue.Queue = queue.Queue(maxsize=2 * max_workers)
+            # Each worker counts its own successes, so no lock is needed
+            processed_counts = [0] * max_workers
+
+            def upload_worker(index: int):
+                while True:
+                    item = file_queue.get()
+                    if item is None:
+                        return
+                    queued_path, user_command = item
+                    try:
+                        if self.process_file(queued_path, user_command):
+                            processed_counts[index] += 1
+                    except Exception as e:
+                        logger.error(f"Failed to process existing file {queued_path}: {str(e)}")
+
+            workers = [
+                threading.Thread(target=upload_worker, args=(i,), name=f"upload-worker-{i}", daemon=True)
+                for i in range(max_workers)
+            ]
+            for worker in workers:
+                worker.start()
+
+            try:
+                # This thread is the producer; put() blocks while the workers are busy
+                for file_path in watch_folder.iterdir():
+                    if file_path.is_file() and file_path.suffix.lower() in supported_extensions:
+                        logger.info(f"Found existing file: {file_path}")
+                        user_command = self.load_sidecar_command(str(file_path))
+                        if not user_command:
+                            with self._prompt_lock:
+                                user_command = self.get_user_command(str(file_path))
+                        if not user_command:
+                            logger.error(f"No valid user command provided, skipping {file_path}")
+                            continue
+                        file_queue.put((str(file_path), user_command))
+            finally:
+                for _ in workers:
+                    file_queue.put(None)
+                for worker in workers:
+                    worker.join()
+
+            files_processed = sum(processed_counts)
 
             logger.info(f"Processed {files_processed} existing files")
 
@@ -328,6 +459,18 @@ Status: {len(present_docs)}/{len(present_docs) + len(missing_docs)} documents fo
         if self.watcher:
             self.watcher.stop()
 
+        if self._prompt_queue is not None:
+            self._prompt_queue.put(None)
+            self._prompt_queue = None
+
+        if self._monitor_executor is not None:
+            # Let uploads that already started finish
+            self._monitor_executor.shutdown(wait=True)
+            self._monitor_executor = None
+
+        if self.notification_manager:
+            self.notification_manager.close()
+
         logger.info("System stopped")
 
 
@@ -338,6 +481,8 @@ def main():
                        default='monitor', help='Running mode')
     parser.add_argument('--file', type=str, help='Process specific file')
     parser.add_argument('--config-check', action='store_true', help='Check configuration only')
+    parser.add_argument('--max-concurrent-uploads', type=int, default=Config.MAX_CONCURRENT_UPLOADS,
+                       help='Maximum files uploaded at once in process-existing mode')
 
     args = parser.parse_args()
 
@@ -375,7 +520,7 @@ def main():
             automation.run_interactive_mode()
         elif args.mode == 'process-existing':
             # Process existing files
-            automation.process_existing_files()
+            automation.process_existing_files(args.max_concurrent_uploads)
 
     except KeyboardInterrupt:
         logger.info("Application stopped by user")
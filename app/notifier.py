@@ -4,16 +4,198 @@ Handles real-time notifications to admin about document processing results
 with checklist-based message templates and enhanced formatting
 """
 
+import asyncio
+import functools
+import hashlib
+import json
+import random
+import string
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
-from typing import Dict, Optional, Any, List
-from datetime import datetime, timedelta
+from typing import Dict, Optional, Any, List, Tuple
+from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import time
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from app.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Retries only cover failures before WAHA accepted the request (connect errors,
+# and 429/5xx on GETs); POSTs are never resent so a message can't go out twice
+_HTTP_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+# Longest wait between notification retries, even if WAHA asks for more
+_MAX_RETRY_DELAY = 60
+# Recently sent notifications remembered for rate limiting
+_NOTIFICATION_HISTORY_SIZE = 10000
+
+
+
+def _dumps(payload: Any) -> bytes:
+    """Encode a request payload as JSON bytes, with orjson when it's installed"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode()
+
+
+@functools.lru_cache(maxsize=1)
+def _timestamp_for_minute(minute: int) -> str:
+    """Format a Unix minute for messages; messages within the same minute share it"""
+    return datetime.fromtimestamp(minute * 60).strftime('%d %B %Y %H:%M')
+
+
+def _minute_timestamp() -> str:
+    """Current time as shown in messages, e.g. '05 March 2025 14:30'"""
+    return _timestamp_for_minute(int(time.time() // 60))
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_template(template: str) -> Tuple[Tuple[str, Optional[str], str, Optional[str]], ...]:
+    """Split a str.format template into (literal, field, spec, conversion) parts, once per template"""
+    return tuple(string.Formatter().parse(template))
+
+
+def _render_template(template: str, values: Dict[str, Any]) -> str:
+    """
+    Fill a str.format template from a dict using its cached parse
+
+    Args:
+        template: Template in str.format syntax
+        values: Values for the template's named fields
+
+    Returns:
+        Formatted message string
+
+    Raises:
+        KeyError: If the template names a field missing from values
+    """
+    parts = []
+    for literal, field, spec, conversion in _parse_template(template):
+        parts.append(literal)
+        if field is None:
+            continue
+        if not field.isidentifier() or '{' in spec:
+            # Attribute/index lookups and nested specs: let str.format handle them
+            return template.format(**values)
+
+        value = values[field]
+        if conversion == 'r':
+            value = repr(value)
+        elif conversion == 'a':
+            value = ascii(value)
+        elif conversion == 's':
+            value = str(value)
+        parts.append(format(value, spec))
+
+    return ''.join(parts)
+
+
+@functools.lru_cache(maxsize=512)
+def _bullets(docs: Tuple[str, ...], limit: int = 5) -> str:
+    """
+    Format documents as a bulleted list, showing at most limit of them
+
+    Args:
+        docs: Document names
+        limit: Number of documents listed before the rest are summarized
+
+    Returns:
+        Bulleted list, empty if there are no documents
+    """
+    text = "\n".join(f"• {doc}" for doc in docs[:limit])
+    if len(docs) > limit:
+        text += f"\n• ... dan {len(docs) - limit} dokumen lainnya"
+    return text
+
+
+@functools.lru_cache(maxsize=256)
+def _chat_id(phone_number: str) -> str:
+    """WAHA chat ID for a phone number"""
+    return f"{phone_number}@c.us"
+
+
+# Documents whose absence triggers an extra alert after upload
+_CRITICAL_DOCS = frozenset(('Akta', 'NIB', 'NPWP', 'KTP Pengurus'))
+
+
+@functools.lru_cache(maxsize=256)
+def _critical_missing(missing_docs: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Pick the critical documents out of a missing-documents tuple, keeping their order"""
+    return tuple(doc for doc in missing_docs if doc in _CRITICAL_DOCS)
+
+
+class _TokenBucket:
+    """Token bucket pacing WAHA sends across threads"""
+
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Args:
+            capacity: Burst size (maximum tokens held)
+            refill_rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        """Add the tokens earned since the last refill (call with the lock held)"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+
+    def acquire(self, n: float = 1, block: bool = True) -> bool:
+        """
+        Take n tokens
+
+        Args:
+            n: Number of tokens to take
+            block: Wait for the tokens if they aren't available yet
+
+        Returns:
+            True once the tokens are taken, False if block is False and they aren't available
+        """
+        if not block:
+            with self._lock:
+                self._refill()
+                if self.tokens < n:
+                    return False
+                self.tokens -= n
+                return True
+
+        delay = self.reserve(n)
+        if delay:
+            time.sleep(delay)
+        return True
+
+    def reserve(self, n: float = 1) -> float:
+        """
+        Take n tokens now, even if they haven't been earned yet
+
+        A negative balance reserves a future slot for this caller, so concurrent
+        callers each get their own slot instead of all seeing the same wait.
+
+        Args:
+            n: Number of tokens to take
+
+        Returns:
+            Seconds the caller must wait before using the tokens (0 if available now)
+        """
+        with self._lock:
+            self._refill()
+            self.tokens -= n
+            return -self.tokens / self.refill_rate if self.tokens < 0 else 0.0
+
 
 class WAHANotifier:
     """
@@ -26,13 +208,47 @@ class WAHANotifier:
         self.api_url = Config.WAHA_API_URL
         self.api_key = Config.WAHA_API_KEY
         self.admin_number = Config.ADMIN_WHATSAPP_NUMBER
+        self._send_url = f"{self.api_url}/api/sendText"
+        self._sessions_url = f"{self.api_url}/api/sessions"
         self.timeout = 30
         self.templates = Config.WHATSAPP_TEMPLATES
         self.notification_settings = Config.NOTIFICATION_SETTINGS
-        self._last_notifications = {}  # Track last notifications to avoid spam
+        self._admin_chat_id = _chat_id(self.admin_number)
+        self._base_payload = {'session': 'default'}  # Fields shared by every sendText request
+        for template in self.templates.values():
+            _parse_template(template)
+        # Content hash -> monotonic send time, oldest first, to avoid spam
+        self._last_notifications: OrderedDict = OrderedDict()
+        self._notification_lock = threading.Lock()
+        self._thread_state = threading.local()  # Retry-After of the last failed send, per thread
+
+        # Pace sends to the WAHA quota; error alerts get a small reserve of their own
+        # so they aren't stuck behind a large batch
+        per_minute = max(self.notification_settings.get("per_minute", 60), 1)
+        self._bucket = _TokenBucket(
+            capacity=max(self.notification_settings.get("burst", 10), 1),
+            refill_rate=per_minute / 60.0
+        )
+        reserve = max(self.notification_settings.get("priority_reserve", 3), 1)
+        self._priority_bucket = _TokenBucket(capacity=reserve, refill_rate=reserve / 60.0)
+
+        # Persistent session so consecutive messages reuse the same connection
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=_HTTP_RETRY)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self._session.headers.update({
+            'x-api-key': self.api_key,
+            'Content-Type': 'application/json'
+        })
+
+    def close(self):
+        """Release pooled HTTP connections"""
+        self._session.close()
 
     def send_upload_notification(self, company_name: str, job_type: str,
-                                file_name: str, completeness_result: Dict[str, Any]) -> bool:
+                                file_name: str, completeness_result: Dict[str, Any],
+                                now_str: Optional[str] = None) -> bool:
         """
         Send notification about successful file upload and completeness check
 
@@ -41,13 +257,14 @@ class WAHANotifier:
             job_type: Type of job/work
             file_name: Name of uploaded file
             completeness_result: Document completeness check result
+            now_str: Timestamp shown in the message (current minute if None)
 
         Returns:
             True if notification sent successfully, False otherwise
         """
         try:
             message = self._format_upload_message(
-                company_name, job_type, file_name, completeness_result
+                company_name, job_type, file_name, completeness_result, now_str
             )
             return self._send_message(message)
 
@@ -55,74 +272,91 @@ class WAHANotifier:
             logger.error(f"Failed to send upload notification: {str(e)}")
             return False
 
-    def send_error_notification(self, error_message: str, context: Dict[str, Any] = None) -> bool:
+    def send_error_notification(self, error_message: str, context: Dict[str, Any] = None,
+                                now_str: Optional[str] = None) -> bool:
         """
         Send error notification to admin
 
         Args:
             error_message: Error description
             context: Additional context information
+            now_str: Timestamp shown in the message (current minute if None)
 
         Returns:
             True if notification sent successfully, False otherwise
         """
         try:
-            message = self._format_error_message(error_message, context)
-            return self._send_message(message)
+            message = self._format_error_message(error_message, context, now_str)
+            return self._send_message(message, priority=True)
 
         except Exception as e:
             logger.error(f"Failed to send error notification: {str(e)}")
             return False
 
     def send_completion_notification(self, company_name: str,
-                                   completeness_result: Dict[str, Any]) -> bool:
+                                   completeness_result: Dict[str, Any],
+                                   now_str: Optional[str] = None) -> bool:
         """
         Send notification about document completeness status
 
         Args:
             company_name: Name of the company
             completeness_result: Document completeness check result
+            now_str: Timestamp shown in the message (current minute if None)
 
         Returns:
             True if notification sent successfully, False otherwise
         """
         try:
-            message = self._format_completion_message(company_name, completeness_result)
+            message = self._format_completion_message(company_name, completeness_result, now_str)
             return self._send_message(message)
 
         except Exception as e:
             logger.error(f"Failed to send completion notification: {str(e)}")
             return False
 
-    def _send_message(self, message: str) -> bool:
+    def _reserve_send_slot(self, priority: bool = False) -> float:
+        """
+        Take the token for one message without waiting for it
+
+        Args:
+            priority: Use the reserved allotment for error alerts first, if any is left
+
+        Returns:
+            Seconds to wait before sending
+        """
+        if priority and self._priority_bucket.acquire(block=False):
+            return 0.0
+        return self._bucket.reserve()
+
+    def _acquire_send_slot(self, priority: bool = False):
+        """
+        Wait until the rate limit allows another message
+
+        Args:
+            priority: Use the reserved allotment for error alerts first, if any is left
+        """
+        delay = self._reserve_send_slot(priority)
+        if delay:
+            time.sleep(delay)
+
+    def _send_message(self, message: str, priority: bool = False) -> bool:
         """
         Send message via WAHA API
 
         Args:
             message: Message content to send
+            priority: Whether this is an error alert that may use the reserved allotment
 
         Returns:
             True if sent successfully, False otherwise
         """
         try:
-            url = f"{self.api_url}/api/sendText"
-            headers = {
-                'x-api-key': self.api_key,
-                'Content-Type': 'application/json'
-            }
+            self._acquire_send_slot(priority)
 
-            payload = {
-                'chatId': f"{self.admin_number}@c.us",
-                'text': message,
-                'session': 'default'
-            }
+            payload = {'chatId': self._admin_chat_id, 'text': message, **self._base_payload}
 
-            response = requests.post(
-                url,
-                json=payload,
-                headers=headers,
-                timeout=self.timeout
-            )
+            response = self._session.post(self._send_url, data=_dumps(payload), timeout=self.timeout)
 
             response.raise_for_status()
 
@@ -131,13 +365,15 @@ class WAHANotifier:
 
         except requests.exceptions.RequestException as e:
             logger.error(f"WAHA API request failed: {str(e)}")
+            self._note_retry_after(e)
             return False
         except Exception as e:
             logger.error(f"Unexpected error sending WhatsApp message: {str(e)}")
             return False
 
     def _format_upload_message(self, company_name: str, job_type: str,
-                              file_name: str, completeness_result: Dict[str, Any]) -> str:
+                              file_name: str, completeness_result: Dict[str, Any],
+                              now_str: Optional[str] = None) -> str:
         """
         Format upload notification message
 
@@ -146,6 +382,7 @@ class WAHANotifier:
             job_type: Type of job/work
             file_name: Name of uploaded file
             completeness_result: Document completeness result
+            now_str: Timestamp shown in the message (current minute if None)
 
         Returns:
             Formatted message string
@@ -154,57 +391,65 @@ class WAHANotifier:
         completion_pct = completeness_result.get('completion_percentage', 0)
         missing_docs = completeness_result.get('missing_documents', [])
 
-        message = f"""📂 *Upload Dokumen Legalitas*
-
-🏢 *Perusahaan:* {company_name}
-⚙️ *Pekerjaan:* {job_type}
-📄 *File:* {file_name}
-{status_emoji} *Kelengkapan:* {completion_pct}%
-
-📅 *Waktu:* {datetime.now().strftime('%d %B %Y %H:%M')}"""
+        parts = [
+            "📂 *Upload Dokumen Legalitas*",
+            "",
+            f"🏢 *Perusahaan:* {company_name}",
+            f"⚙️ *Pekerjaan:* {job_type}",
+            f"📄 *File:* {file_name}",
+            f"{status_emoji} *Kelengkapan:* {completion_pct}%",
+            "",
+            f"📅 *Waktu:* {now_str or _minute_timestamp()}",
+            ""
+        ]
 
         if missing_docs:
-            message += f"\n\n❌ *Dokumen Kurang:* {', '.join(missing_docs)}"
+            parts.append(f"❌ *Dokumen Kurang:* {', '.join(missing_docs)}")
         else:
-            message += "\n\n✅ *Semua dokumen lengkap!*"
+            parts.append("✅ *Semua dokumen lengkap!*")
 
-        message += "\n\n_Sistem Otomasi Legal Dokumen_"
+        parts.extend(("", "_Sistem Otomasi Legal Dokumen_"))
 
-        return message
+        return "\n".join(parts)
 
-    def _format_error_message(self, error_message: str, context: Dict[str, Any] = None) -> str:
+    def _format_error_message(self, error_message: str, context: Dict[str, Any] = None,
+                              now_str: Optional[str] = None) -> str:
         """
         Format error notification message
 
         Args:
             error_message: Error description
             context: Additional context information
+            now_str: Timestamp shown in the message (current minute if None)
 
         Returns:
             Formatted error message
         """
-        message = f"""⚠️ *Error Sistem Legal Dokumen*
-
-🚨 *Pesan:* {error_message}
-📅 *Waktu:* {datetime.now().strftime('%d %B %Y %H:%M')}"""
+        parts = [
+            "⚠️ *Error Sistem Legal Dokumen*",
+            "",
+            f"🚨 *Pesan:* {error_message}",
+            f"📅 *Waktu:* {now_str or _minute_timestamp()}"
+        ]
 
         if context:
-            message += "\n\n*Detail:*"
-            for key, value in context.items():
-                message += f"\n• {key.replace('_', ' ').title()}: {value}"
+            parts.extend(("", "*Detail:*"))
+            parts.extend(f"• {key.replace('_', ' ').title()}: {value}" for key, value in context.items())
 
-        message += "\n\n_Silakan periksa sistem untuk detail lebih lanjut._"
+        parts.extend(("", "_Silakan periksa sistem untuk detail lebih lanjut._"))
 
-        return message
+        return "\n".join(parts)
 
     def _format_completion_message(self, company_name: str,
-                                  completeness_result: Dict[str, Any]) -> str:
+                                  completeness_result: Dict[str, Any],
+                                  now_str: Optional[str] = None) -> str:
         """
         Format document completion status message
 
         Args:
             company_name: Name of the company
             completeness_result: Document completeness result
+            now_str: Timestamp shown in the message (current minute if None)
 
         Returns:
             Formatted completion message
@@ -225,29 +470,29 @@ class WAHANotifier:
 
         emoji = status_emojis.get(status, '📋')
 
-        message = f"""{emoji} *Update Kelengkapan Dokumen*
-
-🏢 *Perusahaan:* {company_name}
-📊 *Status:* {status.replace('_', ' ').title()}
-📈 *Persentase:* {completion_pct}%
-📅 *Update:* {datetime.now().strftime('%d %B %Y %H:%M')}"""
+        parts = [
+            f"{emoji} *Update Kelengkapan Dokumen*",
+            "",
+            f"🏢 *Perusahaan:* {company_name}",
+            f"📊 *Status:* {status.replace('_', ' ').title()}",
+            f"📈 *Persentase:* {completion_pct}%",
+            f"📅 *Update:* {now_str or _minute_timestamp()}"
+        ]
 
         if present_docs:
-            message += f"\n\n✅ *Dokumen Ada ({len(present_docs)}):*"
-            message += f"\n{', '.join(present_docs)}"
+            parts.extend(("", f"✅ *Dokumen Ada ({len(present_docs)}):*", ', '.join(present_docs)))
 
         if missing_docs:
-            message += f"\n\n❌ *Dokumen Kurang ({len(missing_docs)}):*"
-            message += f"\n{', '.join(missing_docs)}"
+            parts.extend(("", f"❌ *Dokumen Kurang ({len(missing_docs)}):*", ', '.join(missing_docs)))
 
         if status == 'complete':
-            message += "\n\n🎊 *Selamat! Semua dokumen legalitas sudah lengkap.*"
+            parts.extend(("", "🎊 *Selamat! Semua dokumen legalitas sudah lengkap.*"))
         elif status == 'error':
-            message += "\n\n⚠️ *Terjadi kesalahan saat memeriksa dokumen.*"
+            parts.extend(("", "⚠️ *Terjadi kesalahan saat memeriksa dokumen.*"))
 
-        message += "\n\n_Sistem Otomasi Legal Dokumen_"
+        parts.extend(("", "_Sistem Otomasi Legal Dokumen_"))
 
-        return message
+        return "\n".join(parts)
 
     def test_connection(self) -> bool:
         """
@@ -257,10 +502,7 @@ class WAHANotifier:
             True if connection successful, False otherwise
         """
         try:
-            url = f"{self.api_url}/api/sessions"
-            headers = {'x-api-key': self.api_key}
-
-            response = requests.get(url, headers=headers, timeout=5)
+            response = self._session.get(self._sessions_url, timeout=5)
             response.raise_for_status()
 
             # If we get here, the connection is successful
@@ -294,7 +536,8 @@ _Sistem Otomasi Legal Dokumen v1.0_"""
         return result
 
     def send_checklist_notification(self, company_name: str, checklist_result: Dict,
-                                   recipient_number: str = None) -> bool:
+                                   recipient_number: str = None,
+                                   now_str: Optional[str] = None) -> bool:
         """
         Send checklist evaluation result notification using template system
 
@@ -302,34 +545,18 @@ _Sistem Otomasi Legal Dokumen v1.0_"""
             company_name: Name of the company
             checklist_result: Checklist evaluation result from ChecklistManager
             recipient_number: Optional recipient number (defaults to admin)
+            now_str: Timestamp shown in the message (current minute if None)
 
         Returns:
             True if notification sent successfully, False otherwise
         """
         try:
-            target_number = recipient_number or self.admin_number
-
-            # Check rate limiting
-            if self._is_rate_limited(f"checklist_{company_name}"):
-                logger.info(f"Checklist notification for {company_name} rate limited")
-                return False
-
-            # Determine template based on completion status
-            if checklist_result.get("status") == "complete":
-                template_name = "checklist_complete"
-            else:
-                template_name = "checklist_incomplete"
-
-            # Format message using template
-            message = self._format_template_message(template_name, company_name, checklist_result)
-
-            success = self._send_message_to_number(message, target_number)
-
-            if success:
-                self._update_notification_timestamp(f"checklist_{company_name}")
-                logger.info(f"Checklist notification sent for {company_name}")
-
-            return success
+            return self._dispatch_notification({
+                'type': 'checklist',
+                'company_name': company_name,
+                'data': checklist_result,
+                'recipient_number': recipient_number
+            }, now_str)
 
         except Exception as e:
             logger.error(f"Failed to send checklist notification: {str(e)}")
@@ -348,20 +575,11 @@ _Sistem Otomasi Legal Dokumen v1.0_"""
             True if notification sent successfully, False otherwise
         """
         try:
-            target_number = recipient_number or self.admin_number
-
-            # Check rate limiting
-            if self._is_rate_limited(f"processing_{company_name}"):
-                return False
-
-            message = self.templates["processing_started"].format(company_name=company_name)
-
-            success = self._send_message_to_number(message, target_number)
-
-            if success:
-                self._update_notification_timestamp(f"processing_{company_name}")
-
-            return success
+            return self._dispatch_notification({
+                'type': 'processing_started',
+                'company_name': company_name,
+                'recipient_number': recipient_number
+            })
 
         except Exception as e:
             logger.error(f"Failed to send processing started notification: {str(e)}")
@@ -381,14 +599,12 @@ _Sistem Otomasi Legal Dokumen v1.0_"""
             True if notification sent successfully, False otherwise
         """
         try:
-            target_number = recipient_number or self.admin_number
-
-            message = self.templates["processing_error"].format(
-                company_name=company_name,
-                error_message=error_message
-            )
-
-            return self._send_message_to_number(message, target_number)
+            return self._dispatch_notification({
+                'type': 'processing_error',
+                'company_name': company_name,
+                'data': {'error_message': error_message},
+                'recipient_number': recipient_number
+            })
 
         except Exception as e:
             logger.error(f"Failed to send processing error notification: {str(e)}")
@@ -396,7 +612,7 @@ _Sistem Otomasi Legal Dokumen v1.0_"""
 
     def send_batch_notifications(self, notifications: List[Dict]) -> Dict[str, bool]:
         """
-        Send multiple notifications in batch
+        Synchronous wrapper around async_send_batch_notifications for callers without an event loop
 
         Args:
             notifications: List of notification dictionaries with keys:
@@ -408,68 +624,169 @@ _Sistem Otomasi Legal Dokumen v1.0_"""
         Returns:
             Dict with notification results
         """
-        results = {}
+        return asyncio.run(self.async_send_batch_notifications(notifications))
+
+    async def async_send_batch_notifications(self, notifications: List[Dict]) -> Dict[str, bool]:
+        """
+        Send multiple notifications concurrently
+
+        Sends run on a thread pool with at most max_concurrent_sends in flight.
+        Each message is formatted and deduplicated here, then takes its token
+        from the rate limiter on the event loop, so batches within the burst go
+        out at once and later ones wait here rather than in a worker thread.
+        Suppressed duplicates never take a token.
+
+        Args:
+            notifications: List of notification dictionaries (see send_batch_notifications)
 
-        for i, notification in enumerate(notifications):
-            try:
-                notif_type = notification.get('type')
-                company_name = notification.get('company_name')
-                data = notification.get('data', {})
-                recipient_number = notification.get('recipient_number')
-
-                if notif_type == 'checklist':
-                    success = self.send_checklist_notification(company_name, data, recipient_number)
-                elif notif_type == 'processing_started':
-                    success = self.send_processing_started_notification(company_name, recipient_number)
-                elif notif_type == 'processing_error':
-                    error_msg = data.get('error_message', 'Unknown error')
-                    success = self.send_processing_error_notification(company_name, error_msg, recipient_number)
-                else:
-                    success = False
-                    logger.warning(f"Unknown notification type: {notif_type}")
-
-                results[f"notification_{i}"] = success
-
-                # Add delay between notifications to avoid rate limiting
-                if i < len(notifications) - 1:
-                    time.sleep(1)
-
-            except Exception as e:
-                logger.error(f"Error sending batch notification {i}: {str(e)}")
-                results[f"notification_{i}"] = False
+        Returns:
+            Dict with notification results
+        """
+        loop = asyncio.get_running_loop()
+        max_concurrent = max(1, self.notification_settings.get("max_concurrent_sends", 5))
+        semaphore = asyncio.Semaphore(max_concurrent)
+        # One timestamp for the whole batch
+        now_str = _minute_timestamp()
+
+        with ThreadPoolExecutor(max_workers=max_concurrent) as pool:
+            async def send(notification: Dict) -> bool:
+                prepared = self._prepare_notification(notification, now_str)
+                if prepared is None:
+                    return False
+                # Reserving (not just peeking at) the token gives each send its own slot
+                wait = self._reserve_send_slot(prepared[4])
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                async with semaphore:
+                    return await loop.run_in_executor(
+                        pool, functools.partial(self._deliver_notification, *prepared, slot_reserved=True)
+                    )
+
+            outcomes = await asyncio.gather(
+                *(send(notification) for notification in notifications),
+                return_exceptions=True
+            )
+
+        results = {}
+        for i, outcome in enumerate(outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Error sending batch notification {i}: {str(outcome)}")
+                outcome = False
+            results[f"notification_{i}"] = outcome
 
         return results
 
-    def _send_message_to_number(self, message: str, phone_number: str) -> bool:
+    def _dispatch_notification(self, notification: Dict, now_str: Optional[str] = None) -> bool:
+        """
+        Send one notification dictionary through the matching send_* method
+
+        Args:
+            notification: Notification dictionary (see send_batch_notifications)
+            now_str: Timestamp shown in the message (current minute if None)
+
+        Returns:
+            True if sent successfully, False otherwise
+        """
+        prepared = self._prepare_notification(notification, now_str)
+        if prepared is None:
+            return False
+        return self._deliver_notification(*prepared)
+
+    def _prepare_notification(self, notification: Dict, now_str: Optional[str] = None
+                              ) -> Optional[Tuple[str, str, Optional[str], Optional[Dict], bool]]:
+        """
+        Format a notification dictionary and claim its rate-limit slot
+
+        Args:
+            notification: Notification dictionary (see send_batch_notifications)
+            now_str: Timestamp shown in the message (current minute if None)
+
+        Returns:
+            (message, target number, notification key, payload, priority) for
+            _deliver_notification, or None if the type is unknown or the same
+            notification was sent recently
+        """
+        notif_type = notification.get('type')
+        company_name = notification.get('company_name')
+        data = notification.get('data', {})
+        target_number = notification.get('recipient_number') or self.admin_number
+
+        if notif_type == 'checklist':
+            # Determine template based on completion status
+            if data.get("status") == "complete":
+                template_name = "checklist_complete"
+            else:
+                template_name = "checklist_incomplete"
+            message = self._format_template_message(template_name, company_name, data, now_str)
+            notification_key = f"checklist_{company_name}"
+        elif notif_type == 'processing_started':
+            message = _render_template(self.templates["processing_started"], {'company_name': company_name})
+            notification_key = f"processing_{company_name}"
+        elif notif_type == 'processing_error':
+            message = _render_template(self.templates["processing_error"], {
+                'company_name': company_name,
+                'error_message': data.get('error_message', 'Unknown error')
+            })
+            # Error alerts are never deduplicated and may use the reserved allotment
+            return message, target_number, None, None, True
+        else:
+            logger.warning(f"Unknown notification type: {notif_type}")
+            return None
+
+        # Check rate limiting
+        payload = {'to': target_number, 'text': message}
+        if self._is_rate_limited(notification_key, payload):
+            logger.info(f"Notification {notification_key} rate limited")
+            return None
+        return message, target_number, notification_key, payload, False
+
+    def _deliver_notification(self, message: str, target_number: str, notification_key: Optional[str],
+                              payload: Optional[Dict], priority: bool, slot_reserved: bool = False) -> bool:
+        """
+        Send a notification prepared by _prepare_notification and settle its rate-limit claim
+
+        Args:
+            message: Message content
+            target_number: Target phone number
+            notification_key: Rate-limit key, or None if the notification isn't deduplicated
+            payload: Rate-limited content
+            priority: Whether this is an error alert that may use the reserved allotment
+            slot_reserved: The rate-limit token was already taken by the caller
+
+        Returns:
+            True if sent successfully, False otherwise
+        """
+        success = self._send_message_to_number(message, target_number, priority, slot_reserved)
+
+        if notification_key is not None:
+            if success:
+                self._update_notification_timestamp(notification_key, payload)
+            else:
+                self._release_notification(notification_key, payload)
+
+        return success
+
+    def _send_message_to_number(self, message: str, phone_number: str,
+                                priority: bool = False, slot_reserved: bool = False) -> bool:
         """
         Send message to specific phone number
 
         Args:
             message: Message content
             phone_number: Target phone number
+            priority: Whether this is an error alert that may use the reserved allotment
+            slot_reserved: The rate-limit token was already taken by the caller
 
         Returns:
             True if sent successfully, False otherwise
         """
         try:
-            url = f"{self.api_url}/api/sendText"
-            headers = {
-                'x-api-key': self.api_key,
-                'Content-Type': 'application/json'
-            }
+            if not slot_reserved:
+                self._acquire_send_slot(priority)
 
-            payload = {
-                'chatId': f"{phone_number}@c.us",
-                'text': message,
-                'session': 'default'
-            }
+            payload = {'chatId': _chat_id(phone_number), 'text': message, **self._base_payload}
 
-            response = requests.post(
-                url,
-                json=payload,
-                headers=headers,
-                timeout=self.timeout
-            )
+            response = self._session.post(self._send_url, data=_dumps(payload), timeout=self.timeout)
 
             response.raise_for_status()
             logger.info(f"WhatsApp message sent to {phone_number}")
@@ -477,13 +794,14 @@ _Sistem Otomasi Legal Dokumen v1.0_"""
 
         except requests.exceptions.RequestException as e:
             logger.error(f"WAHA API request failed: {str(e)}")
+            self._note_retry_after(e)
             return False
         except Exception as e:
             logger.error(f"Unexpected error sending WhatsApp message: {str(e)}")
             return False
 
     def _format_template_message(self, template_name: str, company_name: str,
-                               checklist_result: Dict) -> str:
+                               checklist_result: Dict, now_str: Optional[str] = None) -> str:
         """
         Format message using template system
 
@@ -491,13 +809,14 @@ _Sistem Otomasi Legal Dokumen v1.0_"""
             template_name: Name of the template to use
             company_name: Name of the company
             checklist_result: Checklist evaluation result
+            now_str: Timestamp for the default format (current minute if None)
 
         Returns:
             Formatted message string
         """
         if template_name not in self.templates:
             logger.warning(f"Template {template_name} not found, using default format")
-            return self._format_default_checklist_message(company_name, checklist_result)
+            return self._format_default_checklist_message(company_name, checklist_result, now_str)
 
         template = self.templates[template_name]
 
@@ -506,35 +825,21 @@ _Sistem Otomasi Legal Dokumen v1.0_"""
         found_docs = checklist_result.get("found_documents", [])
         missing_docs = checklist_result.get("missing_documents", [])
 
-        # Format available documents
-        available_docs_text = ""
-        if found_docs:
-            available_docs_text = "\n".join([
-                f"• {doc['required']}" for doc in found_docs[:5]  # Limit to 5 items
-            ])
-            if len(found_docs) > 5:
-                available_docs_text += f"\n• ... dan {len(found_docs) - 5} dokumen lainnya"
-
-        # Format missing documents
-        missing_docs_text = ""
-        if missing_docs:
-            missing_docs_text = "\n".join([
-                f"• {doc}" for doc in missing_docs[:5]  # Limit to 5 items
-            ])
-            if len(missing_docs) > 5:
-                missing_docs_text += f"\n• ... dan {len(missing_docs) - 5} dokumen lainnya"
+        # Format document lists, limited to 5 items each
+        available_docs_text = _bullets(tuple(doc['required'] for doc in found_docs), 5)
+        missing_docs_text = _bullets(tuple(missing_docs), 5)
 
         # Fill template
         try:
-            message = template.format(
-                company_name=company_name,
-                completion_percentage=completion_percentage,
-                available_docs=available_docs_text,
-                missing_docs=missing_docs_text,
-                total_found=len(found_docs),
-                total_missing=len(missing_docs),
-                status=checklist_result.get("status", "unknown")
-            )
+            message = _render_template(template, {
+                'company_name': company_name,
+                'completion_percentage': completion_percentage,
+                'available_docs': available_docs_text,
+                'missing_docs': missing_docs_text,
+                'total_found': len(found_docs),
+                'total_missing': len(missing_docs),
+                'status': checklist_result.get("status", "unknown")
+            })
 
             # Add footer if not already present
             if "_Sistem Otomasi Legal Dokumen_" not in message:
@@ -544,15 +849,17 @@ _Sistem Otomasi Legal Dokumen v1.0_"""
 
         except KeyError as e:
             logger.error(f"Template formatting error: missing key {str(e)}")
-            return self._format_default_checklist_message(company_name, checklist_result)
+            return self._format_default_checklist_message(company_name, checklist_result, now_str)
 
-    def _format_default_checklist_message(self, company_name: str, checklist_result: Dict) -> str:
+    def _format_default_checklist_message(self, company_name: str, checklist_result: Dict,
+                                          now_str: Optional[str] = None) -> str:
         """
         Default message formatting if template fails
 
         Args:
             company_name: Name of the company
             checklist_result: Checklist evaluation result
+            now_str: Timestamp shown in the message (current minute if None)
 
         Returns:
             Formatted message string
@@ -576,18 +883,40 @@ _Sistem Otomasi Legal Dokumen v1.0_"""
 📊 *Status:* {status.replace('_', ' ').title()}
 📈 *Kelengkapan:* {completion_percentage}% ({found_count}/{total_required} dokumen)
 
-📅 *Waktu:* {datetime.now().strftime('%d %B %Y %H:%M')}
+📅 *Waktu:* {now_str or _minute_timestamp()}
 
 _Sistem Otomasi Legal Dokumen_"""
 
         return message
 
-    def _is_rate_limited(self, notification_key: str) -> bool:
+    @staticmethod
+    def _payload_hash(notification_key: str, payload: Any) -> str:
         """
-        Check if notification should be rate limited
+        Build the dedupe key for a notification's content
 
         Args:
             notification_key: Unique key for the notification type
+            payload: Notification content
+
+        Returns:
+            SHA-256 hex digest of the key and content
+        """
+        if orjson is not None:
+            content = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str)
+        else:
+            content = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.sha256(notification_key.encode() + b"|" + content).hexdigest()
+
+    def _is_rate_limited(self, notification_key: str, payload: Any = None) -> bool:
+        """
+        Check if the same notification was sent recently, and claim it if not
+
+        Lookup and claim happen under one lock, so two threads sending the same
+        content at once can't both get through.
+
+        Args:
+            notification_key: Unique key for the notification type
+            payload: Notification content; only identical content is rate limited
 
         Returns:
             True if rate limited, False otherwise
@@ -595,30 +924,119 @@ _Sistem Otomasi Legal Dokumen_"""
         if not self.notification_settings.get("auto_send_checklist_results", True):
             return True
 
-        delay_minutes = self.notification_settings.get("notification_delay_minutes", 1)
-
-        if notification_key in self._last_notifications:
-            last_time = self._last_notifications[notification_key]
-            time_diff = datetime.now() - last_time
+        delay_sec = self.notification_settings.get("notification_delay_minutes", 1) * 60
+        digest = self._payload_hash(notification_key, payload)
+        now = time.monotonic()
 
-            if time_diff < timedelta(minutes=delay_minutes):
+        with self._notification_lock:
+            self._purge_expired_notifications(now, delay_sec)
+            if digest in self._last_notifications:
                 return True
+            self._remember_notification(digest, now)
 
         return False
 
-    def _update_notification_timestamp(self, notification_key: str):
+    def _purge_expired_notifications(self, now: float, delay_sec: float):
+        """
+        Drop notifications sent longer ago than the rate-limit window (call with the lock held)
+
+        Args:
+            now: Current monotonic time
+            delay_sec: Rate-limit window in seconds
+        """
+        while self._last_notifications:
+            digest, sent_at = next(iter(self._last_notifications.items()))
+            if now - sent_at < delay_sec:
+                break
+            del self._last_notifications[digest]
+
+    def _remember_notification(self, digest: str, sent_at: float):
+        """
+        Record a notification as the newest entry, evicting the oldest past the size limit
+        (call with the lock held)
+
+        Args:
+            digest: Dedupe key from _payload_hash
+            sent_at: Monotonic send time
+        """
+        self._last_notifications[digest] = sent_at
+        self._last_notifications.move_to_end(digest)
+        if len(self._last_notifications) > _NOTIFICATION_HISTORY_SIZE:
+            self._last_notifications.popitem(last=False)
+
+    def _update_notification_timestamp(self, notification_key: str, payload: Any = None):
         """
         Update the timestamp for the last sent notification
 
         Args:
             notification_key: Unique key for the notification type
+            payload: Notification content
+        """
+        digest = self._payload_hash(notification_key, payload)
+        with self._notification_lock:
+            self._remember_notification(digest, time.monotonic())
+
+    def _release_notification(self, notification_key: str, payload: Any = None):
+        """
+        Drop the claim taken by _is_rate_limited after a failed send, so a retry can go out
+
+        Args:
+            notification_key: Unique key for the notification type
+            payload: Notification content
         """
-        self._last_notifications[notification_key] = datetime.now()
+        digest = self._payload_hash(notification_key, payload)
+        with self._notification_lock:
+            self._last_notifications.pop(digest, None)
+
+    def _note_retry_after(self, error: requests.exceptions.RequestException):
+        """
+        Remember the Retry-After of a rate-limited send for the calling thread
+
+        Args:
+            error: Exception raised by the failed request
+        """
+        response = getattr(error, 'response', None)
+        retry_after = None
+        if response is not None and response.status_code == 429:
+            retry_after = response.headers.get('Retry-After')
+        self._thread_state.retry_after = int(retry_after) if retry_after and retry_after.isdigit() else None
+
+    def _dispatch_with_retry_after(self, notification: Dict) -> Tuple[bool, Optional[int]]:
+        """
+        Send one notification and report how long WAHA asked us to wait if it was rate limited
+
+        Args:
+            notification: Notification dictionary (see send_batch_notifications)
+
+        Returns:
+            (success, Retry-After seconds or None)
+        """
+        self._thread_state.retry_after = None
+        success = self._dispatch_notification(notification)
+        return success, getattr(self._thread_state, 'retry_after', None)
 
     def retry_failed_notifications(self, failed_notifications: List[Dict],
                                   max_retries: int = None) -> Dict[str, bool]:
         """
-        Retry failed notifications with exponential backoff
+        Synchronous wrapper around async_retry_failed_notifications for callers without an event loop
+
+        Args:
+            failed_notifications: List of failed notification dictionaries
+            max_retries: Maximum number of retries (defaults to config)
+
+        Returns:
+            Dict with retry results
+        """
+        return asyncio.run(self.async_retry_failed_notifications(failed_notifications, max_retries))
+
+    async def async_retry_failed_notifications(self, failed_notifications: List[Dict],
+                                              max_retries: int = None) -> Dict[str, bool]:
+        """
+        Retry failed notifications concurrently with jittered exponential backoff
+
+        Each notification waits 2^attempt seconds plus up to 0.5s of jitter between
+        attempts, or the Retry-After WAHA sent with a 429. Waits don't hold a
+        worker, so notifications back off independently of each other.
 
         Args:
             failed_notifications: List of failed notification dictionaries
@@ -630,39 +1048,37 @@ _Sistem Otomasi Legal Dokumen_"""
         if max_retries is None:
             max_retries = self.notification_settings.get("max_retries", 3)
 
-        results = {}
-
-        for i, notification in enumerate(failed_notifications):
-            success = False
+        loop = asyncio.get_running_loop()
+        max_concurrent = max(1, self.notification_settings.get("max_concurrent_sends", 5))
+        semaphore = asyncio.Semaphore(max_concurrent)
 
-            for attempt in range(max_retries):
-                try:
-                    # Exponential backoff: wait 2^attempt seconds
+        with ThreadPoolExecutor(max_workers=max_concurrent) as pool:
+            async def retry(i: int, notification: Dict) -> bool:
+                retry_after = None
+                for attempt in range(max_retries):
                     if attempt > 0:
-                        time.sleep(2 ** attempt)
+                        delay = retry_after if retry_after is not None else 2 ** attempt + random.random() * 0.5
+                        await asyncio.sleep(min(delay, _MAX_RETRY_DELAY))
 
-                    notif_type = notification.get('type')
-                    company_name = notification.get('company_name')
-                    data = notification.get('data', {})
-                    recipient_number = notification.get('recipient_number')
+                    try:
+                        async with semaphore:
+                            success, retry_after = await loop.run_in_executor(
+                                pool, self._dispatch_with_retry_after, notification
+                            )
+                        if success:
+                            return True
 
-                    if notif_type == 'checklist':
-                        success = self.send_checklist_notification(company_name, data, recipient_number)
-                    elif notif_type == 'processing_started':
-                        success = self.send_processing_started_notification(company_name, recipient_number)
-                    elif notif_type == 'processing_error':
-                        error_msg = data.get('error_message', 'Unknown error')
-                        success = self.send_processing_error_notification(company_name, error_msg, recipient_number)
+                    except Exception as e:
+                        retry_after = None
+                        logger.error(f"Retry {attempt + 1} failed for notification {i}: {str(e)}")
 
-                    if success:
-                        break
-
-                except Exception as e:
-                    logger.error(f"Retry {attempt + 1} failed for notification {i}: {str(e)}")
+                return False
 
-            results[f"retry_notification_{i}"] = success
+            outcomes = await asyncio.gather(
+                *(retry(i, notification) for i, notification in enumerate(failed_notifications))
+            )
 
-        return results
+        return {f"retry_notification_{i}": success for i, success in enumerate(outcomes)}
 
 
 class EnhancedNotificationManager:
@@ -674,6 +1090,10 @@ class EnhancedNotificationManager:
         """Initialize notification manager"""
         self.waha_notifier = WAHANotifier()
 
+    def close(self):
+        """Release pooled HTTP connections"""
+        self.waha_notifier.close()
+
     def test_all_notifications(self) -> Dict[str, bool]:
         """
         Test all notification systems
@@ -709,9 +1129,11 @@ class EnhancedNotificationManager:
             True if notifications sent successfully, False otherwise
         """
         try:
+            now_str = _minute_timestamp()
+
             # Send upload notification
             upload_success = self.waha_notifier.send_upload_notification(
-                company_name, job_type, file_name, completeness_result
+                company_name, job_type, file_name, completeness_result, now_str
             )
 
             # If there are critical missing documents, send additional alert
@@ -723,7 +1145,8 @@ class EnhancedNotificationManager:
                         'company': company_name,
                         'job_type': job_type,
                         'missing_critical': critical_missing
-                    }
+                    },
+                    now_str
                 )
 
             return upload_success
@@ -742,9 +1165,8 @@ class EnhancedNotificationManager:
         Returns:
             List of critical missing document types
         """
-        critical_docs = ['Akta', 'NIB', 'NPWP', 'KTP Pengurus']
         missing_docs = completeness_result.get('missing_documents', [])
-        return [doc for doc in missing_docs if doc in critical_docs]
+        return list(_critical_missing(tuple(missing_docs)))
 
     def notify_system_error(self, error_message: str, context: Dict[str, Any] = None) -> bool:
         """